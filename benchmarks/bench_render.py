@@ -0,0 +1,256 @@
+"""Micro-benchmarks of rendering model instances.
+
+Run from the repository root, without any database server:
+
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --json before.json
+    python benchmarks/bench_render.py --compare before.json
+
+For each case the rate of calls, the peak memory allocated by one call
+(using tracemalloc) and the number of queries of one call are reported.
+The 'django' cases are the default Model.__str__ and Model.__repr__
+of a model with 10 fields, as a baseline.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(
+    DEBUG=False,
+    DATABASES={
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        },
+    },
+    INSTALLED_APPS=['django_dunder'],
+    DUNDER_AUTO=False,
+)
+django.setup()
+
+from django.db import connection, models  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from django_dunder import app_settings  # noqa: E402
+from django_dunder._formatter import (  # noqa: E402
+    FormattableObjectWrapper,
+    compile_attr_fmt,
+)
+from django_dunder.core import _model_repr, _model_str  # noqa: E402
+from django_dunder.mixins import DunderModel  # noqa: E402
+
+MODIFIER_FMT = '{name}={value.round__ellipsis_20}'
+
+
+def make_model(name, fields, base=DunderModel, **meta):
+    meta['app_label'] = 'bench'
+    attrs = {
+        '__module__': __name__,
+        'Meta': type('Meta', (object, ), meta),
+    }
+    attrs.update(fields)
+    model = type(name, (base, ), attrs)
+    with connection.schema_editor() as editor:
+        editor.create_model(model)
+    return model
+
+
+def plain_fields(count):
+    fields = {}
+    for i in range(count):
+        if i % 2:
+            fields['number{}'.format(i)] = models.IntegerField(null=True)
+        else:
+            fields['name{}'.format(i)] = models.CharField(
+                max_length=20, null=True)
+    return fields
+
+
+def plain_values(model):
+    values = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key:
+            continue
+        if isinstance(field, models.IntegerField):
+            values[field.attname] = 10 ** 6 + len(values)
+        else:
+            values[field.attname] = 'value {}'.format(len(values))
+    return values
+
+
+def load(model, **values):
+    """Return an instance loaded from the database, as in a view."""
+    obj = model.objects.create(**values)
+    return model.objects.get(pk=obj.pk)
+
+
+def build_cases():
+    cases = []
+
+    def add_model_cases(label, obj):
+        cases.append((label + ' repr', _model_repr, obj))
+        cases.append((label + ' str', _model_str, obj))
+
+    for count in (2, 10, 50, 200):
+        model = make_model('Plain{}'.format(count), plain_fields(count))
+        obj = load(model, **plain_values(model))
+        add_model_cases('{} fields'.format(count), obj)
+
+    fields = plain_fields(10)
+    fields['name0'] = models.CharField(max_length=20, unique=True)
+    model = make_model('UniqueField', fields)
+    add_model_cases('unique field', load(model, **plain_values(model)))
+
+    model = make_model(
+        'UniqueTogether', plain_fields(10),
+        unique_together=[('name0', 'number1')])
+    add_model_cases('unique_together', load(model, **plain_values(model)))
+
+    target = make_model('Target', {
+        'name': models.CharField(max_length=20, unique=True),
+    })
+    targets = [target.objects.create(name='t{}'.format(i)) for i in range(10)]
+    fields = {}
+    for i in range(10):
+        fields['target{}'.format(i)] = models.ForeignKey(
+            target, related_name='+', on_delete=models.CASCADE)
+    model = make_model('ForeignKeys', fields)
+    obj = model.objects.create(**dict(
+        ('target{}'.format(i), targets[i]) for i in range(10)))
+    add_model_cases('10 FKs', model.objects.get(pk=obj.pk))
+    add_model_cases(
+        '10 FKs select_related',
+        model.objects.select_related().get(pk=obj.pk))
+
+    fields = {}
+    for i in range(10):
+        fields['value{}'.format(i)] = models.FloatField()
+    model = make_model('Floats', fields)
+    obj = load(model, **dict(
+        ('value{}'.format(i), i + 1 / 3.0) for i in range(10)))
+    cases.append(('modifier format str', _model_str, obj, MODIFIER_FMT))
+
+    cases.append((
+        'wrapper chain',
+        lambda value: MODIFIER_FMT.format(
+            name='value', value=FormattableObjectWrapper(value)),
+        1 / 3.0,
+    ))
+    compiled = compile_attr_fmt(MODIFIER_FMT)
+    cases.append((
+        'compiled chain',
+        lambda value: compiled.format(name='value', value=value),
+        1 / 3.0,
+    ))
+
+    model = make_model('Django10', plain_fields(10), base=models.Model)
+    obj = load(model, **plain_values(model))
+    cases.append(('django repr', repr, obj))
+    cases.append(('django str', str, obj))
+
+    return cases
+
+
+def peak_memory(func, arg):
+    """Return the peak bytes allocated by one call of func."""
+    if tracemalloc is None or not hasattr(tracemalloc, 'reset_peak'):
+        return None
+
+    tracemalloc.start()
+    try:
+        func(arg)
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        func(arg)
+        return tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+
+def query_count(func, arg):
+    with CaptureQueriesContext(connection) as queries:
+        func(arg)
+    return len(queries)
+
+
+def run_case(func, arg, number, repeat):
+    func(arg)
+    timer = timeit.Timer(lambda: func(arg))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {
+        'ops': number / best,
+        'memory': peak_memory(func, arg),
+        'queries': query_count(func, arg),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-n', '--number', type=int, default=2000,
+        help='calls in each timing')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='timings of each case, the best is reported')
+    parser.add_argument(
+        '-k', '--filter', default='',
+        help='only run cases containing this text')
+    parser.add_argument('--json', help='save the results to this file')
+    parser.add_argument(
+        '--compare', help='show the change from results saved with --json')
+    args = parser.parse_args(argv)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    results = {}
+    print('{:<28} {:>12} {:>10} {:>8} {:>8}'.format(
+        'case', 'ops/sec', 'bytes', 'queries', 'change'))
+    for case in build_cases():
+        label, func, arg = case[:3]
+        if args.filter not in label:
+            continue
+
+        fmt = case[3] if len(case) > 3 else None
+        old_fmt = app_settings.STR_ATTR_FMT
+        if fmt:
+            app_settings.STR_ATTR_FMT = fmt
+        try:
+            result = run_case(func, arg, args.number, args.repeat)
+        finally:
+            app_settings.STR_ATTR_FMT = old_fmt
+        results[label] = result
+
+        change = ''
+        if label in previous:
+            change = '{:+.1%}'.format(
+                result['ops'] / previous[label]['ops'] - 1)
+        print('{:<28} {:>12,.0f} {:>10} {:>8} {:>8}'.format(
+            label, result['ops'],
+            '-' if result['memory'] is None else result['memory'],
+            result['queries'], change))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
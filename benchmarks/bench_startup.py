@@ -0,0 +1,241 @@
+"""Benchmark of the time and memory django-dunder adds to django.setup().
+
+A synthetic project is generated in a temporary directory, with models
+spread over several apps and covering abstract bases, proxies,
+multi-table inheritance, custom dunders and __unicode__ variants.
+Each measurement is done in a new interpreter, without django_dunder in
+INSTALLED_APPS, and with it using either registration mode:
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --models 3000 --apps 50
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The kinds of model generated, in turn
+KINDS = ('plain', 'abstract', 'proxy', 'mti', 'unicode', 'custom')
+
+UNICODE_VARIANTS = (
+    # Only __unicode__
+    '    def __unicode__(self):\n'
+    '        return self.name\n',
+    # __unicode__ duplicating __str__
+    '    def __str__(self):\n'
+    '        return self.name\n'
+    '\n'
+    '    __unicode__ = __str__\n',
+    # __unicode__ different to __str__
+    '    def __str__(self):\n'
+    '        return self.name\n'
+    '\n'
+    '    def __unicode__(self):\n'
+    '        return self.name.upper()\n',
+)
+
+HEADER = '''from django.db import models
+
+
+class Base(models.Model):
+    created = models.DateTimeField(null=True)
+    updated = models.DateTimeField(null=True)
+
+    class Meta:
+        abstract = True
+
+'''
+
+CHILD = '''
+from django.conf import settings
+import json
+import sys
+import time
+import warnings
+
+sys.path[:0] = {path!r}
+settings.configure(
+    DEBUG=False,
+    DATABASES={{}},
+    INSTALLED_APPS={apps!r},
+    **{extra!r}
+)
+
+import django
+
+if {memory!r}:
+    import tracemalloc
+    tracemalloc.start()
+
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter('always')
+    start = time.perf_counter()
+    django.setup()
+    elapsed = time.perf_counter() - start
+
+from django.apps import apps
+
+result = {{
+    'time': elapsed,
+    'models': len(apps.get_models(include_auto_created=True)),
+    'warnings': len(caught),
+}}
+if {memory!r}:
+    result['memory'] = tracemalloc.get_traced_memory()[0]
+print(json.dumps(result))
+'''
+
+
+def model_source(index, previous_plain):
+    """Return the source of one model, and whether it is a plain model."""
+    kind = KINDS[index % len(KINDS)]
+    name = 'Model{}'.format(index)
+    fields = (
+        '    name = models.CharField(max_length=50)\n'
+        '    number = models.IntegerField(null=True)\n'
+    )
+
+    if kind == 'abstract':
+        return 'class {}(Base):\n{}'.format(name, fields), False
+
+    if kind == 'proxy' and previous_plain:
+        return (
+            'class {}({}):\n'
+            '    class Meta:\n'
+            '        proxy = True\n'.format(name, previous_plain),
+            False)
+
+    if kind == 'mti' and previous_plain:
+        return (
+            'class {}({}):\n'
+            '    extra = models.TextField(null=True)\n'.format(
+                name, previous_plain),
+            False)
+
+    if kind == 'unicode':
+        variant = UNICODE_VARIANTS[(index // len(KINDS)) % 3]
+        return 'class {}(models.Model):\n{}\n{}'.format(
+            name, fields, variant), False
+
+    if kind == 'custom':
+        return (
+            'class {}(models.Model):\n{}\n'
+            '    def __str__(self):\n'
+            '        return self.name\n'
+            '\n'
+            '    def __repr__(self):\n'
+            '        return "<{} %s>" % self.pk\n'.format(name, fields, name),
+            False)
+
+    return 'class {}(models.Model):\n{}'.format(name, fields), True
+
+
+def generate_project(path, model_count, app_count):
+    """Write the apps of the project to path, returning their names."""
+    app_names = []
+    per_app = -(-model_count // app_count)
+    index = 0
+    for app in range(app_count):
+        app_name = 'bench_app{}'.format(app)
+        app_dir = os.path.join(path, app_name)
+        os.mkdir(app_dir)
+        open(os.path.join(app_dir, '__init__.py'), 'w').close()
+
+        parts = [HEADER]
+        previous_plain = None
+        for _ in range(min(per_app, model_count - index)):
+            source, is_plain = model_source(index, previous_plain)
+            if is_plain:
+                previous_plain = 'Model{}'.format(index)
+            parts.append('\n' + source + '\n')
+            index += 1
+
+        with open(os.path.join(app_dir, 'models.py'), 'w') as f:
+            f.write(''.join(parts))
+        app_names.append(app_name)
+
+    return app_names
+
+
+def measure(path, apps, extra, memory=False):
+    source = CHILD.format(
+        path=[path, ROOT], apps=apps, extra=extra, memory=memory)
+    output = subprocess.check_output(
+        [sys.executable, '-c', source], cwd=path)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-m', '--models', type=int, default=3000,
+        help='number of models generated')
+    parser.add_argument(
+        '-a', '--apps', type=int, default=30,
+        help='number of apps the models are spread over')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='interpreters started for each timing, the median is reported')
+    parser.add_argument(
+        '--keep', action='store_true',
+        help='keep the generated project, and print its location')
+    args = parser.parse_args(argv)
+
+    path = tempfile.mkdtemp(prefix='dunder_startup_')
+    try:
+        app_names = generate_project(path, args.models, args.apps)
+        configurations = (
+            ('without dunder', app_names, {}),
+            ('with dunder', ['django_dunder'] + app_names, {}),
+            ('with dunder at ready', ['django_dunder'] + app_names,
+             {'DUNDER_REGISTER_AT_READY': True}),
+        )
+
+        print('{:<24} {:>8} {:>12} {:>12} {:>10}'.format(
+            'configuration', 'models', 'setup ms', 'memory KiB', 'warnings'))
+        results = []
+        for label, apps, extra in configurations:
+            times = []
+            for _ in range(args.repeat):
+                result = measure(path, apps, extra)
+                times.append(result['time'])
+            result['time'] = median(times)
+            result['memory'] = measure(
+                path, apps, extra, memory=True)['memory']
+            results.append(result)
+
+            print('{:<24} {:>8} {:>12.1f} {:>12,.0f} {:>10}'.format(
+                label, result['models'], result['time'] * 1000,
+                result['memory'] / 1024.0, result['warnings']))
+
+        without = results[0]
+        for (label, apps, extra), result in zip(
+                configurations[1:], results[1:]):
+            print('{:<24} {:>8} {:>12.1f} {:>12,.0f}'.format(
+                'added ' + label[5:], '',
+                (result['time'] - without['time']) * 1000,
+                (result['memory'] - without['memory']) / 1024.0))
+    finally:
+        if args.keep:
+            print('Project kept in', path)
+        else:
+            shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main()
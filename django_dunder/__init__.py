@@ -4,3 +4,66 @@ __version__ = VERSION = (0, 3, 0)
 import django_dunder._meta_options  # noqa
 
 default_app_config = 'django_dunder.apps.DunderConfig'
+
+
+def render_queryset(queryset, mode='str'):
+    """Yield the str or repr of each row of queryset, without instances.
+
+    See django_dunder.bulk.render_queryset
+    """
+    from .bulk import render_queryset
+    return render_queryset(queryset, mode)
+
+
+def render_instances(instances, mode='str', fetch_related=True):
+    """Return the str or repr of each of instances, loading them in batches.
+
+    See django_dunder.bulk.render_instances
+    """
+    from .bulk import render_instances
+    return render_instances(instances, mode, fetch_related)
+
+
+def stats(reset=False):
+    """Return the statistics of rendering recorded with DUNDER_STATS.
+
+    See django_dunder._stats.stats
+    """
+    from ._stats import stats
+    return stats(reset)
+
+
+def lazy(obj, mode='repr'):
+    """Return obj wrapped to be rendered only when needed, e.g. in logs.
+
+    See django_dunder._lazy.LazyRender
+    """
+    from ._lazy import LazyRender
+    return LazyRender(obj, mode)
+
+
+def astr(obj):
+    """Return a coroutine rendering the str of obj, for async code.
+
+    See django_dunder._async.arender
+    """
+    from ._async import arender
+    return arender(obj, 'str')
+
+
+def arepr(obj):
+    """Return a coroutine rendering the repr of obj, for async code.
+
+    See django_dunder._async.arender
+    """
+    from ._async import arender
+    return arender(obj, 'repr')
+
+
+def arender_queryset(queryset, mode='str'):
+    """Return an async iterator of the str or repr of each row of queryset.
+
+    See django_dunder._async.arender_queryset
+    """
+    from ._async import arender_queryset
+    return arender_queryset(queryset, mode)
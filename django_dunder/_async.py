@@ -0,0 +1,77 @@
+"""Rendering from async code, loading what is needed with the async ORM.
+
+Python 3 only, imported when used.
+"""
+import itertools
+
+from asgiref.sync import sync_to_async
+from django.db.models.query import QuerySet
+
+from .bulk import _row_renderer
+from .core import _get_mode
+from ._load import Loader, QueryLoad
+
+_BUILTINS = {
+    'repr': repr,
+    'str': str,
+}
+
+# The rows read from the database at a time
+CHUNK_SIZE = 2000
+
+# Django 4.1 added async iteration of querysets
+_ASYNC_ITERATION = hasattr(QuerySet, '__aiter__')
+
+
+async def _arun(load):
+    if _ASYNC_ITERATION and isinstance(load, QueryLoad):
+        load.set_rows([row async for row in load.queryset()])
+    else:
+        await sync_to_async(load.run)()
+
+
+async def aload(instances, mode):
+    """Load what rendering instances in mode needs, in batches.
+
+    Return whether rendering them can not issue queries.
+    """
+    loader = Loader(instances, mode)
+    for loads in loader.loads():
+        for load in loads:
+            await _arun(load)
+    return loader.complete
+
+
+async def arender(obj, mode='str'):
+    """Return the str or repr of obj, loading what it shows first.
+
+    The deferred fields and related objects which rendering would load
+    are loaded in batches with the async ORM.  Objects which could still
+    issue queries, such as models not using django-dunder, are rendered
+    in a thread.
+    """
+    _get_mode(mode)
+    render = _BUILTINS[mode]
+    if await aload([obj], mode):
+        return render(obj)
+    return await sync_to_async(render)(obj)
+
+
+def _next_chunk(iterator):
+    return list(itertools.islice(iterator, CHUNK_SIZE))
+
+
+async def arender_queryset(queryset, mode='str'):
+    """Yield the str or repr of each row of queryset, like render_queryset.
+
+    The rows are read in chunks in a thread, for use with 'async for'.
+    """
+    rows, render_row = _row_renderer(queryset, mode, ())
+    # values_list().aiterator() would query in the event loop
+    iterator = await sync_to_async(rows.iterator)(chunk_size=CHUNK_SIZE)
+    while True:
+        chunk = await sync_to_async(_next_chunk)(iterator)
+        if not chunk:
+            break
+        for row in chunk:
+            yield render_row(row)[1]
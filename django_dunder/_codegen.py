@@ -0,0 +1,354 @@
+"""Generate specialised rendering functions for a RenderPlan.
+
+In the style of dataclasses, the source of a function is built for each
+model and format settings, with the field accessors, the constant parts
+of the format strings and the separators baked in.
+"""
+import string
+
+from ._fields import (
+    is_binary_field,
+    is_container_field,
+    is_text_field,
+    stores_value,
+    str_formatter,
+)
+from ._formatter import (
+    FormattableObjectWrapper,
+    compile_attr_fmt,
+    limit_container,
+    limit_value,
+    shorten,
+)
+
+_DEBUG = False
+
+_NAME = object()
+
+_formatter = string.Formatter()
+
+_CONVERSIONS = (None, 's', 'r')
+
+
+def _parse_attr_fmt(fmt):
+    """Split an attribute format around its only '{value}'.
+
+    Return (before, conversion, after) where before and after are lists of
+    literal strings and the _NAME marker, or None if the format uses
+    anything more than a plain '{name}' and a plain '{value}'.
+    """
+    before = []
+    after = None
+    conversion = None
+    for literal, field_name, spec, conv in _formatter.parse(fmt):
+        target = before if after is None else after
+        if literal:
+            target.append(literal)
+        if field_name is None:
+            continue
+        if spec:
+            return None
+        if field_name == 'name' and not conv:
+            target.append(_NAME)
+        elif field_name == 'value' and after is None and conv in _CONVERSIONS:
+            conversion = conv
+            after = []
+        else:
+            return None
+
+    if after is None:
+        return None
+
+    return before, conversion, after
+
+
+def _parse_instance_fmt(fmt):
+    """Split an instance format into its three literal strings.
+
+    Return None if the format is not two plain positional fields.
+    """
+    literals = []
+    field_names = []
+    for literal, field_name, spec, conv in _formatter.parse(fmt):
+        literals.append(literal)
+        if field_name is None:
+            continue
+        if spec or conv:
+            return None
+        field_names.append(field_name)
+
+    if field_names not in (['', ''], ['0', '1']):
+        return None
+
+    if len(literals) == 2:
+        literals.append('')
+
+    return literals
+
+
+def _join(parts, name):
+    return ''.join(name if part is _NAME else part for part in parts)
+
+
+def _convert_expr(index, field, conversion, value_name, namespace):
+    """Return the expression converting a value of field to str."""
+    if conversion == 'r':
+        return 'repr({})'.format(value_name)
+
+    formatter = str_formatter(field)
+    if formatter:
+        formatter_name = '_tf_{}'.format(index)
+        namespace[formatter_name] = formatter
+        return '{}({})'.format(formatter_name, value_name)
+
+    if is_text_field(field):
+        return '({0} if {0}.__class__ is str else str({0}))'.format(
+            value_name)
+
+    return 'str({})'.format(value_name)
+
+
+def _format_lines(index, field, name, value_name, attr_fmt, simple, wrapper,
+                  namespace, width=None, container_repr=None):
+    """Return the source lines which append one formatted field.
+
+    field may be None for values which are not of the field type,
+    such as the key of a related object.
+    The value is shortened to about width, if provided, and containers
+    in values of container fields are summarised using container_repr.
+    """
+    lines = []
+    if container_repr is not None and is_container_field(field):
+        namespace['_container_repr'] = container_repr
+        lines.append('{0} = _limit_container({0}, _container_repr)'.format(
+            value_name))
+    if width is not None or is_binary_field(field):
+        lines.append('{0} = _limit({0}, {1!r})'.format(value_name, width))
+    else:
+        width = None
+
+    if simple and wrapper is FormattableObjectWrapper:
+        before, conversion, after = simple
+        prefix = _join(before, name)
+        suffix = _join(after, name)
+        expr = _convert_expr(index, field, conversion, value_name, namespace)
+        if width is not None:
+            # Allow for the quotes of a shortened str
+            expr = '_shorten({}, {!r})'.format(
+                expr, width + 2 if conversion == 'r' else width)
+        if prefix:
+            expr = '{!r} + {}'.format(prefix, expr)
+        if suffix:
+            expr = '{} + {!r}'.format(expr, suffix)
+        if prefix or suffix:
+            return lines + ['_append({})'.format(expr)]
+    else:
+        fmt_name = '_fmt_{}'.format(index)
+        compiled = None
+        if wrapper is FormattableObjectWrapper:
+            compiled = compile_attr_fmt(attr_fmt)
+        if compiled:
+            namespace[fmt_name] = compiled
+            expr = '{}.format(name={!r}, value={})'.format(
+                fmt_name, name, value_name)
+        else:
+            namespace[fmt_name] = attr_fmt
+            expr = '{}.format(name={!r}, value=_wrap({}))'.format(
+                fmt_name, name, value_name)
+
+    return lines + [
+        '_s = {}'.format(expr),
+        'if _s:',
+        '    _append(_s)',
+    ]
+
+
+def _getter_expr(plan, index, field, getter_name, attr_name, skip_deferred):
+    """Return the expression obtaining one value from the instance 'self'."""
+    if not skip_deferred:
+        return 'self.{}'.format(attr_name)
+
+    if attr_name == field.attname and stores_value(plan.model, field):
+        return '_d.get({!r}, _placeholder)'.format(attr_name)
+
+    return '{}(self, _f{})'.format(getter_name, index)
+
+
+def compile_renderer(plan, instance_fmt, attr_fmt, wrapper, model_name_getter,
+                     skip_deferred=False, placeholder=None,
+                     value_getter=None, key_getter=None,
+                     related_getter=None, related_id_class=None,
+                     path_getter=None, max_field_length=None,
+                     max_length=None, container_repr=None):
+    """Return a function rendering instances as described by plan.
+
+    The returned function takes a model instance.  It has an attribute
+    'emit' which is the function formatting the model name and the
+    values, so that values obtained elsewhere can be rendered, an
+    attribute 'capture' returning the arguments of emit for an instance,
+    an attribute 'fields' with the fields of those values in order,
+    'columns' with the names to query those values by, and the 'plan'.
+
+    Values are read from the instance attributes, unless skip_deferred
+    is set.  Then deferred fields have the value placeholder, and
+    value_getter and key_getter are used for fields which can not be read
+    from the instance __dict__, for the plan key_fields using key_getter.
+
+    If related_getter is provided, it is used for the plan related_fields,
+    and when it returns a related_id_class the field is shown using its
+    attname instead.
+
+    path_getter is used for the plan paths, taking the instance and the
+    RelatedPath.
+
+    Values are shortened to about max_field_length, and the text of all
+    fields to max_length, if provided.  Containers in the values of
+    container fields are shown using container_repr, if provided.
+    """
+    namespace = {
+        '_wrap': wrapper,
+        '_value': value_getter,
+        '_key': key_getter,
+        '_related': related_getter,
+        '_RelatedId': related_id_class,
+        '_path': path_getter,
+        '_model_name': model_name_getter,
+        '_instance_fmt': instance_fmt,
+        '_placeholder': placeholder,
+        '_limit': limit_value,
+        '_limit_container': limit_container,
+        '_shorten': shorten,
+    }
+    simple = _parse_attr_fmt(attr_fmt)
+
+    # No field can use more than the whole budget
+    widths = [width for width in (max_field_length, max_length)
+              if width is not None]
+    width = min(widths) if widths else None
+
+    fields = [field for field, name in plan.items]
+    columns = [
+        name if name in plan.paths else field.attname
+        for field, name in plan.items]
+    value_names = ['v{}'.format(i) for i in range(len(fields))]
+    getters = []
+    body = [
+        '_parts = []',
+        '_append = _parts.append',
+    ]
+    for i, (field, name) in enumerate(plan.items):
+        value_name = value_names[i]
+        path = plan.paths.get(name)
+        is_key = field in plan.key_fields and not path
+        # The key of a relation is not formatted like the related object,
+        # nor a list of values like one value
+        lines = _format_lines(
+            i, None if is_key or (path and path.many) else field, name,
+            value_name, attr_fmt, simple, wrapper, namespace, width,
+            container_repr)
+        if path:
+            namespace['_p{}'.format(i)] = path
+            getters.append('_path(self, _p{})'.format(i))
+        elif is_key:
+            getters.append(_getter_expr(
+                plan, i, field, '_key', field.attname, skip_deferred))
+        elif related_getter and field in plan.related_fields:
+            getters.append('_related(self, _f{})'.format(i))
+            id_lines = _format_lines(
+                '{}_id'.format(i), None, field.attname, value_name,
+                attr_fmt, simple, wrapper, namespace)
+            lines = [
+                'if {}.__class__ is _RelatedId:'.format(value_name),
+                '    {0} = {0}.value'.format(value_name),
+            ] + ['    ' + line for line in id_lines] + [
+                'else:',
+            ] + ['    ' + line for line in lines]
+        else:
+            getters.append(_getter_expr(
+                plan, i, field, '_value', field.name, skip_deferred))
+
+        is_default = plan.default_predicates[i]
+        if is_default:
+            predicate_name = '_is_default_{}'.format(i)
+            namespace[predicate_name] = is_default
+            body.append('if {0} and not {1}({0}):'.format(
+                value_name, predicate_name))
+        else:
+            body.append('if {}:'.format(value_name))
+        body.extend('    ' + line for line in lines)
+
+    if plan.drop_pk:
+        body += [
+            'if len(_parts) == 2:',
+            '    del _parts[0]',
+        ]
+
+    body.append("_attrs = ', '.join(_parts)")
+    if max_length is not None:
+        body.append('_attrs = _shorten(_attrs, {!r})'.format(max_length))
+
+    pk_field = plan.pk_field
+    if pk_field is not None and pk_field not in fields:
+        fields.append(pk_field)
+        columns.append(pk_field.attname)
+        value_names.append('_pk')
+        getters.append(_getter_expr(
+            plan, len(getters), pk_field, '_value', pk_field.name,
+            skip_deferred))
+        pk_lines = _format_lines(
+            'pk', pk_field, pk_field.name, '_pk',
+            attr_fmt, simple, wrapper, namespace)
+        body += [
+            'if not _attrs and _pk:',
+            '    _parts = []',
+            '    _append = _parts.append',
+        ] + ['    ' + line for line in pk_lines] + [
+            "    _attrs = ''.join(_parts)",
+        ]
+
+    literals = _parse_instance_fmt(instance_fmt)
+    if literals:
+        expr = ' + '.join(
+            part for part in (
+                repr(literals[0]) if literals[0] else None,
+                '_model_name_str',
+                repr(literals[1]) if literals[1] else None,
+                '_attrs',
+                repr(literals[2]) if literals[2] else None,
+            ) if part)
+        body.append('return {}'.format(expr))
+    else:
+        body.append('return _instance_fmt.format(_model_name_str, _attrs)')
+
+    for i, field in enumerate(fields):
+        namespace['_f{}'.format(i)] = field
+
+    args = ', '.join(['_model_name(self.__class__)'] + getters)
+    prelude = ''
+    if any(getter.startswith('_d.') for getter in getters):
+        prelude = '    _d = self.__dict__\n'
+
+    src = (
+        'def _emit({}):\n{}\n\n'
+        'def _render(self):\n{}    return _emit({})\n\n'
+        'def _capture(self):\n{}    return ({},)\n'
+    ).format(
+        ', '.join(['_model_name_str'] + value_names),
+        '\n'.join('    ' + line for line in body),
+        prelude, args,
+        prelude, args,
+    )
+
+    if _DEBUG:
+        print(src)
+
+    exec(src, namespace)
+    render = namespace['_render']
+    render.emit = namespace['_emit']
+    render.capture = namespace['_capture']
+    render.fields = tuple(fields)
+    render.columns = tuple(columns)
+    render.plan = plan
+    render.__qualname__ = render.__name__ = '_render_{}_{}'.format(
+        plan.model.__name__, plan.meta_field_name)
+    return render
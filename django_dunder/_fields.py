@@ -0,0 +1,154 @@
+"""Handling of the values of specific Django field classes.
+
+The functions are chosen once for each field when a plan or renderer is
+built, so the value of typed fields is shown the same way everywhere.
+"""
+from django.db import models
+
+try:
+    from django.db.models.query_utils import DeferredAttribute
+except ImportError:  # Django < 1.10
+    DeferredAttribute = None
+
+# Callable defaults which always return an equal value
+_DEFAULT_FACTORIES = (
+    dict, list, set, frozenset, tuple, str, bytes, int, float, bool)
+
+_CONTAINERS = (dict, list, set, frozenset, tuple)
+
+# Matched by name, as they are in optional or newer modules
+_CONTAINER_FIELD_NAMES = frozenset(('JSONField', 'ArrayField', 'HStoreField'))
+
+
+def _choice_formatter(field):
+    labels = dict(field.flatchoices)
+
+    def choice_str(value):
+        try:
+            label = labels.get(value, value)
+        except TypeError:  # unhashable
+            label = value
+        return str(label)
+
+    return choice_str
+
+
+def _decimal_formatter(field):
+    spec = '.{}f'.format(field.decimal_places)
+
+    def decimal_str(value):
+        try:
+            return format(value, spec)
+        except (TypeError, ValueError):
+            return str(value)
+
+    return decimal_str
+
+
+def _datetime_str(value):
+    try:
+        return value.isoformat(' ')
+    except (AttributeError, TypeError):
+        return str(value)
+
+
+def _date_str(value):
+    try:
+        return value.isoformat()
+    except AttributeError:
+        return str(value)
+
+
+def str_formatter(field):
+    """Return the function converting values of field to str.
+
+    None is returned if str() is suitable.
+    """
+    if field is None:
+        return None
+
+    if field.choices:
+        return _choice_formatter(field)
+
+    if isinstance(field, models.DecimalField):
+        if field.decimal_places is not None:
+            return _decimal_formatter(field)
+    elif isinstance(field, models.DateTimeField):
+        return _datetime_str
+    elif isinstance(field, models.DateField):
+        return _date_str
+
+    return None
+
+
+def is_text_field(field):
+    """Return True if the values of field are normally already str."""
+    return (
+        isinstance(field, (models.CharField, models.TextField)) and
+        not field.choices)
+
+
+def is_binary_field(field):
+    """Return True if the values of field are bytes or memoryview."""
+    return isinstance(field, models.BinaryField)
+
+
+def is_container_field(field):
+    """Return True if the values of field are often large containers."""
+    return any(
+        cls.__name__ in _CONTAINER_FIELD_NAMES
+        for cls in type(field).__mro__)
+
+
+def stores_value(model, field):
+    """Return True if the value of field is read from the instance __dict__.
+
+    Fields with descriptors which modify the value, e.g. FileField,
+    return False.
+    """
+    attname = field.attname
+    for cls in model.__mro__:
+        if attname in cls.__dict__:
+            descriptor = cls.__dict__[attname]
+            break
+    else:
+        return True
+
+    if DeferredAttribute is None:
+        return False
+
+    return type(descriptor).__get__ is DeferredAttribute.__get__
+
+
+def default_predicate(field):
+    """Return a function testing whether a truthy value is the field default.
+
+    None is returned when no truthy value can be the default, which is
+    the case for most fields.  Callable defaults are only evaluated if
+    they always return an equal value.
+    """
+    default = field.default
+    if callable(default):
+        if default not in _DEFAULT_FACTORIES:
+            # Could differ each time, e.g. uuid.uuid4
+            return None
+        default = default()
+
+    if default is models.NOT_PROVIDED or not default:
+        return None
+
+    if isinstance(default, _CONTAINERS):
+        # Avoid comparing large values with the default
+        default_class = default.__class__
+        size = len(default)
+
+        def is_default(value):
+            return (
+                value.__class__ is default_class and
+                len(value) == size and
+                value == default)
+    else:
+        def is_default(value):
+            return value == default
+
+    return is_default
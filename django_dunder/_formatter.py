@@ -1,8 +1,16 @@
+import itertools
+import string
+
 try:
     __builtins__ = builtins
 except NameError:
     pass
 
+try:
+    from _string import formatter_field_name_split
+except ImportError:  # Python 2
+    formatter_field_name_split = str._formatter_field_name_split
+
 _DEBUG = False
 
 # Very crude; not really sure about this approach,
@@ -155,3 +163,317 @@ class FormattableObjectWrapper(object):
             return rv
         except Exception:
             return str(self._obj)
+
+
+
+def shorten(text, width, tail='...'):
+    """Return text, shortened to width with tail appended if longer."""
+    if len(text) > width:
+        return text[:max(width - len(tail), 0)] + tail
+    return text
+
+
+class BinarySummary(object):
+    """Shown in place of binary content."""
+
+    __slots__ = ('size', )
+
+    def __init__(self, value):
+        self.size = value.nbytes if isinstance(value, memoryview) else len(value)
+
+    def __repr__(self):
+        return '<{} bytes>'.format(self.size)
+
+    __str__ = __repr__
+
+
+def limit_value(value, width=None):
+    """Prepare a value to be shown in about width characters.
+
+    A str is shortened before it is formatted, and the content of binary
+    values is summarised instead of shown.
+    """
+    cls = value.__class__
+    if cls is str:
+        if width is not None:
+            return shorten(value, width)
+    elif cls is bytes or cls is bytearray or cls is memoryview:
+        return BinarySummary(value)
+    return value
+
+class ContainerRepr(object):
+    """Like reprlib.Repr, for the builtin containers used by JSON values.
+
+    Containers nested deeper than max_depth are shown as '[...]',
+    only max_items of each container are shown followed by the number
+    of remaining items, and str items are shortened to max_string.
+    Dict keys keep their order.  Any limit may be None.
+    """
+
+    __slots__ = ('max_depth', 'max_items', 'max_string')
+
+    def __init__(self, max_depth=None, max_items=None, max_string=None):
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string = max_string
+
+    def repr(self, obj):
+        return self._repr(obj, self.max_depth)
+
+    def _repr(self, obj, level):
+        cls = obj.__class__
+        if cls is dict:
+            return self._repr_items(
+                obj, level, '{', '}', self._dict_items(obj, level))
+        if cls is list:
+            return self._repr_items(obj, level, '[', ']')
+        if cls is tuple:
+            if len(obj) == 1 and level != 0:
+                return '({},)'.format(self._repr(obj[0], _next(level)))
+            return self._repr_items(obj, level, '(', ')')
+        if cls is set or cls is frozenset:
+            if not obj:
+                return repr(obj)
+            text = self._repr_items(obj, level, '{', '}')
+            if cls is frozenset:
+                text = 'frozenset({})'.format(text)
+            return text
+        if cls is str and self.max_string is not None:
+            return repr(shorten(obj, self.max_string))
+        return repr(obj)
+
+    def _dict_items(self, obj, level):
+        level = _next(level)
+        for key, value in obj.items():
+            yield '{}: {}'.format(
+                self._repr(key, level), self._repr(value, level))
+
+    def _repr_items(self, obj, level, start, end, items=None):
+        if not obj:
+            return start + end
+        if level == 0:
+            return start + '...' + end
+
+        if items is None:
+            level = _next(level)
+            items = (self._repr(item, level) for item in obj)
+
+        if self.max_items is not None:
+            items = list(itertools.islice(items, self.max_items))
+            remaining = len(obj) - len(items)
+            if remaining > 0:
+                items.append('...({} more)'.format(remaining))
+
+        return start + ', '.join(items) + end
+
+
+def _next(level):
+    return None if level is None else level - 1
+
+
+class ContainerSummary(object):
+    """Shown in place of a container, with the text of a ContainerRepr."""
+
+    __slots__ = ('text', )
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return self.text
+
+    __str__ = __repr__
+
+
+def limit_container(value, container_repr):
+    """Summarise a builtin container value using container_repr.
+
+    Other values are returned unchanged.
+    """
+    if value.__class__ in _CONTAINERS:
+        return ContainerSummary(container_repr.repr(value))
+    return value
+
+
+_CONTAINERS = frozenset((dict, list, tuple, set, frozenset))
+
+_formatter = string.Formatter()
+
+# How a modifier name is found for a type; see FormattableObjectWrapper
+_ATTR, _BUILTIN, _WRAPPER = 1, 2, 3
+
+_resolved = {}
+
+_compiled = {}
+
+
+def _resolve(cls, func_name):
+    key = (cls, func_name)
+    try:
+        return _resolved[key]
+    except KeyError:
+        pass
+
+    if getattr(cls, func_name, None):
+        kind = _ATTR
+    elif __builtins__.get(func_name, None):
+        kind = _BUILTIN
+    elif FormattableObjectWrapper.__dict__.get(func_name, None):
+        kind = _WRAPPER
+    else:
+        kind = None
+
+    _resolved[key] = kind
+    return kind
+
+
+def _invoke(obj, func_name, args):
+    """Apply one modifier as FormattableObjectWrapper.__getattr__ does.
+
+    Return None if the modifier is not applicable.
+    """
+    kind = _resolve(obj.__class__, func_name)
+    if kind == _ATTR:
+        attr = getattr(obj, func_name, None)
+    elif kind == _BUILTIN:
+        attr = __builtins__[func_name]
+        args = [obj] + args
+    elif kind == _WRAPPER:
+        wrapper = FormattableObjectWrapper(obj)
+        attr = FormattableObjectWrapper.__dict__[func_name]
+        args = [wrapper] + args
+    else:
+        return None
+
+    if attr and (args or callable(attr)):
+        try:
+            rv = attr(*args)
+        except Exception:
+            return None
+        if kind == _WRAPPER and rv is wrapper:
+            return None
+        return rv
+
+
+def _parse_chain(name):
+    steps = []
+    remainder = name
+    while remainder:
+        func_name, args, remainder = _get_one_invoke(remainder)
+        steps.append((func_name, args))
+    return tuple(steps)
+
+
+class _CompiledField(object):
+    """One replacement field, with its modifier chains pre-parsed."""
+
+    __slots__ = ('arg', 'accessors', 'conversion', 'spec')
+
+    def __init__(self, arg, accessors, conversion, spec):
+        self.arg = arg
+        self.accessors = accessors
+        self.conversion = conversion
+        self.spec = spec
+
+    def render(self, obj):
+        # Only the value is wrapped, and only until it is indexed
+        wrapped = self.arg == 'value'
+        for is_attr, key in self.accessors:
+            if not is_attr:
+                if wrapped:
+                    obj = _getitem(obj, key)
+                    wrapped = False
+                else:
+                    obj = obj[key]
+            elif not wrapped:
+                obj = getattr(obj, key)
+            else:
+                last = len(key) - 1
+                for i, (func_name, args) in enumerate(key):
+                    rv = _invoke(obj, func_name, list(args))
+                    if rv and (i < last or rv != obj):
+                        obj = rv
+
+        conversion = self.conversion
+        if conversion == 'r':
+            obj = repr(obj)
+        elif conversion == 's' or (wrapped and conversion is None):
+            obj = str(obj)
+        elif conversion == 'a':
+            obj = ascii(obj)
+
+        return format(obj, self.spec)
+
+
+def _getitem(obj, key):
+    """Index obj as FormattableObjectWrapper.__getitem__ does."""
+    if isinstance(key, str) and ':' in key:
+        parts = key.split(':')
+        parts = [int(part) for part in parts]
+        key = slice(*parts)
+    try:
+        return obj.__getitem__(key)
+    except Exception:
+        return str(obj)
+
+
+class CompiledFormat(object):
+    """An attribute format with its modifier chains parsed once.
+
+    format() gives the same result as the format string would with the
+    value wrapped in a FormattableObjectWrapper, except that the value
+    is not wrapped.
+    """
+
+    __slots__ = ('fmt', 'pieces')
+
+    def __init__(self, fmt, pieces):
+        self.fmt = fmt
+        self.pieces = pieces
+
+    def format(self, **kwargs):
+        out = []
+        for literal, field in self.pieces:
+            if literal:
+                out.append(literal)
+            if field is not None:
+                out.append(field.render(kwargs[field.arg]))
+        return ''.join(out)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.fmt)
+
+
+def compile_attr_fmt(fmt):
+    """Return the CompiledFormat of fmt, or None if it is not supported."""
+    try:
+        return _compiled[fmt]
+    except KeyError:
+        pass
+
+    pieces = []
+    try:
+        for literal, field_name, spec, conversion in _formatter.parse(fmt):
+            if field_name is None:
+                pieces.append((literal, None))
+                continue
+
+            if '{' in spec:
+                raise ValueError('Nested replacement field')
+
+            arg, rest = formatter_field_name_split(field_name)
+            if arg not in ('name', 'value'):
+                raise ValueError('Unknown field {!r}'.format(arg))
+
+            accessors = tuple(
+                (is_attr, _parse_chain(key) if is_attr and arg == 'value' else key)
+                for is_attr, key in rest)
+            pieces.append(
+                (literal, _CompiledField(arg, accessors, conversion, spec)))
+    except ValueError:
+        compiled = None
+    else:
+        compiled = CompiledFormat(fmt, tuple(pieces))
+
+    _compiled[fmt] = compiled
+    return compiled
@@ -0,0 +1,98 @@
+"""Detection of queries issued while rendering, with DUNDER_QUERY_GUARD.
+
+The guard is 'warn', 'raise' or 'record'.  When disabled, the renderers
+are not wrapped at all.
+"""
+import collections
+import functools
+import threading
+import warnings
+
+from ._queries import call_recording_queries
+
+# The latest queries found in 'record' mode
+records = collections.deque(maxlen=1000)
+
+_lock = threading.Lock()
+
+
+class RenderQueryWarning(RuntimeWarning):
+    """Emitted when rendering an instance issued queries."""
+
+
+class RenderQueryError(RuntimeError):
+    """Raised when rendering an instance issued queries."""
+
+
+def loaded_names(instance):
+    """Return the names of the values and related objects held by instance."""
+    names = set(instance.__dict__)
+    fields_cache = getattr(
+        getattr(instance, '_state', None), 'fields_cache', None)
+    if fields_cache:
+        names.update(fields_cache)
+    return names
+
+
+def _cache_name(field):
+    try:
+        return field.cache_name
+    except AttributeError:  # Django < 5.1
+        get_cache_name = getattr(field, 'get_cache_name', None)
+        return get_cache_name() if get_cache_name else None
+
+
+def loaded_fields(instance, before):
+    """Return the names of fields loaded since loaded_names was before."""
+    loaded = loaded_names(instance) - before
+    if not loaded:
+        return []
+
+    names = []
+    for field in instance._meta.fields:
+        candidates = {field.attname, field.name, _cache_name(field)}
+        if candidates & loaded:
+            names.append(field.name)
+    return names
+
+
+def describe(instance, mode, fields, queries):
+    """Return the message about queries issued rendering instance."""
+    return '{} of {} issued {} queries{}: {}'.format(
+        mode,
+        instance.__class__._meta.label,
+        len(queries),
+        ', loading ' + ', '.join(fields) if fields else '',
+        '; '.join(queries),
+    )
+
+
+def guard(render, mode, action):
+    """Return render wrapped to warn, raise or record its queries."""
+    @functools.wraps(render)
+    def guarded(self):
+        before = loaded_names(self)
+        rv, queries = call_recording_queries(render, self)
+        if not queries:
+            return rv
+
+        fields = loaded_fields(self, before)
+        message = describe(self, mode, fields, queries)
+        if action == 'record':
+            with _lock:
+                records.append({
+                    'model': self.__class__._meta.label,
+                    'mode': mode,
+                    'fields': fields,
+                    'queries': queries,
+                    'message': message,
+                })
+            return rv
+
+        if action == 'raise':
+            raise RenderQueryError(message)
+
+        warnings.warn(message, RenderQueryWarning)
+        return rv
+
+    return guarded
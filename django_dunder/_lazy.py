@@ -0,0 +1,74 @@
+"""Model instances rendered only when a log record is formatted."""
+import copy
+
+from django.db import models
+
+from .core import _get_mode, get_renderer
+from ._plan import _uses_dunder
+
+_BUILTINS = {
+    'repr': repr,
+    'str': str,
+}
+
+
+class _Rendered(object):
+    """A related object, rendered when its instance was captured."""
+
+    __slots__ = ('_str', '_repr')
+
+    def __init__(self, obj):
+        self._str = str(obj)
+        self._repr = repr(obj)
+
+    def __str__(self):
+        return self._str
+
+    def __repr__(self):
+        return self._repr
+
+
+def _freeze(value):
+    """Return value, unaffected by later changes of the objects it holds."""
+    if isinstance(value, models.Model):
+        return _Rendered(value)
+    if isinstance(value, list):
+        return [_freeze(item) for item in value]
+    if isinstance(value, (dict, set)):
+        return copy.deepcopy(value)
+    return value
+
+
+class LazyRender(object):
+    """The repr or str of an object, computed when first needed.
+
+    The values of the fields of a model using django-dunder are obtained
+    when created, and only formatted when converted to str, once.
+    Related objects shown are rendered when created, and containers are
+    copied, so that later changes and queries do not affect the text.
+    Other objects are rendered using their own method, when needed.
+    """
+
+    __slots__ = ('_func', '_args', '_text')
+
+    def __init__(self, obj, mode='repr'):
+        meta_field_name = _get_mode(mode)[0]
+
+        self._text = None
+        cls = obj.__class__
+        if (isinstance(obj, models.Model) and
+                _uses_dunder(cls, meta_field_name)):
+            renderer = get_renderer(cls, mode)
+            self._func = renderer.emit
+            self._args = tuple(_freeze(arg) for arg in renderer.capture(obj))
+        else:
+            self._func = _BUILTINS[mode]
+            self._args = (obj, )
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self._func(*self._args)
+            self._func = self._args = None
+        return self._text
+
+    __repr__ = __str__
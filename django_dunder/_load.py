@@ -0,0 +1,273 @@
+"""Loading in batches what rendering instances would otherwise query.
+
+The deferred fields and related objects needed to render a list of
+instances are found one level of relations at a time, and grouped so
+that each level needs one query for each model with deferred fields, one
+for each model referenced by foreign keys, and one for each other
+relation.  The loads can be run synchronously, or with the
+async ORM, after which the instances are rendered without queries.
+"""
+try:
+    from django.db.models import prefetch_related_objects
+except ImportError:  # Django < 1.10
+    from django.db.models.query import (
+        prefetch_related_objects as _prefetch_related_objects,
+    )
+
+    def prefetch_related_objects(model_instances, *related_lookups):
+        _prefetch_related_objects(model_instances, related_lookups)
+
+from . import app_settings
+from ._plan import _uses_dunder, get_plan
+from .core import _related_objects
+
+
+def _set_cached(field, instance, value):
+    try:
+        field.set_cached_value(instance, value)
+    except AttributeError:  # Django < 2.0
+        setattr(instance, field.get_cache_name(), value)
+
+
+class QueryLoad(object):
+    """A load using one query, which can be run with the async ORM."""
+
+    def queryset(self):
+        raise NotImplementedError
+
+    def set_rows(self, rows):
+        raise NotImplementedError
+
+    def run(self):
+        self.set_rows(self.queryset())
+
+
+class DeferredLoad(QueryLoad):
+    """The deferred fields attnames of instances of one model."""
+
+    def __init__(self, model, db, attnames):
+        self.model = model
+        self.db = db
+        self.attnames = attnames
+        self.instances = []
+
+    def queryset(self):
+        pks = [instance.pk for instance in self.instances]
+        return self.model._base_manager.db_manager(self.db).filter(
+            pk__in=pks).values_list('pk', *self.attnames)
+
+    def set_rows(self, rows):
+        values = dict((row[0], row[1:]) for row in rows)
+        for instance in self.instances:
+            row = values.get(instance.pk)
+            if row is None:  # Deleted since loaded
+                continue
+            for attname, value in zip(self.attnames, row):
+                setattr(instance, attname, value)
+
+
+class ObjectLoad(QueryLoad):
+    """The objects of one model referenced by foreign keys of instances.
+
+    All the relations to the same target field are loaded together.
+    """
+
+    def __init__(self, model, db, target):
+        self.model = model
+        self.db = db
+        self.target = target
+        # (instance, relation) pairs
+        self.references = []
+
+    def queryset(self):
+        keys = set(
+            getattr(instance, relation.attname)
+            for instance, relation in self.references)
+        keys.discard(None)
+        return self.model._base_manager.db_manager(self.db).filter(
+            **{self.target.name + '__in': keys})
+
+    def set_rows(self, rows):
+        attname = self.target.attname
+        objects = dict((getattr(obj, attname), obj) for obj in rows)
+        for instance, relation in self.references:
+            _set_cached(
+                relation, instance,
+                objects.get(getattr(instance, relation.attname)))
+
+
+class RelatedLoad(object):
+    """A relation of instances of one model, loaded by prefetching."""
+
+    def __init__(self, lookup):
+        self.lookup = lookup
+        self.instances = []
+
+    def run(self):
+        prefetch_related_objects(self.instances, self.lookup)
+
+
+def _fetch_related(plan, fetch_related=None):
+    if fetch_related is None:
+        fetch_related = plan.fetch_related
+    if fetch_related is None:
+        fetch_related = app_settings.FETCH_RELATED
+    return fetch_related
+
+
+def _is_foreign_key(relation):
+    return (relation.many_to_one or relation.one_to_one) and relation.concrete
+
+
+class _Level(object):
+    """The loads of one level of relations."""
+
+    def __init__(self, skip_deferred):
+        self.skip_deferred = skip_deferred
+        self.deferred = {}
+        self.follow = []
+
+    def defer(self, instance, attname):
+        attnames = self.deferred.setdefault(id(instance), (instance, []))[1]
+        if attname not in attnames:
+            attnames.append(attname)
+
+    def add_field(self, instance, field, fetch, related):
+        """Add the loads of a field of instance shown."""
+        if field.attname not in instance.__dict__ and (
+                not self.skip_deferred or related and fetch):
+            self.defer(instance, field.attname)
+        if related:
+            self.follow.append((instance, field, field.name, fetch, None))
+
+    def add_path(self, instance, path, index, fetch):
+        """Add the loads of path from the index relation of instance."""
+        if index == len(path.relations):
+            field = path.field
+            self.add_field(instance, field, fetch, field.is_relation)
+            return
+
+        relation = path.relations[index]
+        # The key of a forward single-valued relation is needed to load it
+        if (fetch and relation.concrete and not relation.many_to_many and
+                relation.attname not in instance.__dict__):
+            self.defer(instance, relation.attname)
+        self.follow.append((
+            instance, relation, path.accessors[index], fetch,
+            (path, index + 1)))
+
+    def deferred_loads(self):
+        loads = {}
+        for instance, attnames in self.deferred.values():
+            key = (instance.__class__, instance._state.db, tuple(attnames))
+            load = loads.get(key)
+            if load is None:
+                load = loads[key] = DeferredLoad(*key)
+            load.instances.append(instance)
+        return list(loads.values())
+
+    def related_loads(self):
+        loads = {}
+        for instance, relation, accessor, fetch, path in self.follow:
+            if not fetch or _related_objects(
+                    instance, relation, accessor, False) is not None:
+                continue
+            if instance.pk is None and not _is_foreign_key(relation):
+                continue
+
+            if _is_foreign_key(relation):
+                target = relation.target_field
+                key = (target.model, instance._state.db, target)
+                load = loads.get(key)
+                if load is None:
+                    load = loads[key] = ObjectLoad(*key)
+                load.references.append((instance, relation))
+                continue
+
+            key = (instance.__class__, accessor)
+            load = loads.get(key)
+            if load is None:
+                load = loads[key] = RelatedLoad(accessor)
+            load.instances.append(instance)
+        return list(loads.values())
+
+    def next_items(self):
+        """Return the related objects shown, after the loads were run."""
+        items = []
+        for instance, relation, accessor, fetch, path in self.follow:
+            related = _related_objects(instance, relation, accessor, False)
+            if not related:
+                continue
+            if path is None:
+                items.extend(related)
+            else:
+                path, index = path
+                items.extend((obj, path, index, fetch) for obj in related)
+        return items
+
+
+class Loader(object):
+    """The loads needed to render instances in mode without queries.
+
+    Iterating over loads() yields lists of loads, and each list must be
+    run before continuing.  complete is False if a model shown does not
+    use django-dunder, so that rendering may still issue queries.
+    """
+
+    def __init__(self, instances, mode, fetch_related=None):
+        self.meta_field_name = mode + '_fields'
+        self.instances = instances
+        # Overrides the fetching of related objects of the instances
+        self.fetch_related = fetch_related
+        self.complete = True
+
+    def loads(self):
+        seen = set()
+        # Instances to render, or (instance, path, index, fetch)
+        items = list(self.instances)
+        fetch_related = self.fetch_related
+        while items:
+            level = _Level(app_settings.SKIP_DEFERRED)
+            for item in items:
+                if isinstance(item, tuple):
+                    level.add_path(*item)
+                    continue
+
+                if id(item) in seen:
+                    continue
+                seen.add(id(item))
+
+                cls = item.__class__
+                if not _uses_dunder(cls, self.meta_field_name):
+                    self.complete = False
+                    continue
+
+                plan = get_plan(cls, self.meta_field_name)
+                fetch = _fetch_related(plan, fetch_related)
+                for field, name in plan.items:
+                    path = plan.paths.get(name)
+                    if path:
+                        level.add_path(item, path, 0, fetch)
+                    else:
+                        level.add_field(
+                            item, field, fetch, field in plan.related_fields)
+                if plan.pk_field is not None:
+                    level.add_field(item, plan.pk_field, fetch, False)
+
+            yield level.deferred_loads()
+            yield level.related_loads()
+            items = level.next_items()
+            # Related objects are rendered using their own settings
+            fetch_related = None
+
+
+def load(instances, mode, fetch_related=None):
+    """Load what rendering instances in mode needs, in batches.
+
+    Return whether rendering them can not issue queries.
+    """
+    loader = Loader(instances, mode, fetch_related)
+    for loads in loader.loads():
+        for item in loads:
+            item.run()
+    return loader.complete
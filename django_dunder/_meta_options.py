@@ -3,4 +3,5 @@ from django.db.models import options
 # Django doesn't support adding third-party fields to model class Meta.
 if 'repr_fields' not in options.DEFAULT_NAMES:
     options.DEFAULT_NAMES = options.DEFAULT_NAMES + (
-        'repr_fields', 'str_fields')
+        'repr_fields', 'str_fields', 'dunder_fetch_related',
+        'dunder_max_length', 'dunder_max_field_length')
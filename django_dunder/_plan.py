@@ -0,0 +1,331 @@
+from django.apps import apps as global_apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import fields
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.signals import class_prepared
+
+try:
+    from django.core.signals import setting_changed
+except ImportError:  # Django < 1.8
+    from django.test.signals import setting_changed
+
+from . import app_settings
+from ._fields import default_predicate
+
+_plans = {}
+
+_MISSING = object()
+
+
+class RelatedPath(object):
+    """A field of related objects, named like 'author__name'.
+
+    relations are the relation fields followed from the model, with the
+    attribute names they are accessed by in accessors, and field is the
+    field of the last related model which is shown.  A path which follows
+    a many-valued relation is 'many', and its value is a list.
+    """
+
+    __slots__ = ('name', 'relations', 'accessors', 'field', 'many')
+
+    def __init__(self, name, relations, accessors, field, many):
+        self.name = name
+        self.relations = relations
+        self.accessors = accessors
+        self.field = field
+        self.many = many
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.name)
+
+
+def _accessor_name(relation):
+    if relation.auto_created and not relation.concrete:
+        # The reverse side of a relation
+        return relation.get_accessor_name()
+    return relation.name
+
+
+def resolve_path(model, name):
+    """Return the RelatedPath for name, or None if it is not valid."""
+    parts = name.split(LOOKUP_SEP)
+    relations = []
+    many = False
+    try:
+        for part in parts[:-1]:
+            relation = model._meta.get_field(part)
+            if not relation.is_relation or relation.related_model is None:
+                return None
+            relations.append(relation)
+            many = many or relation.many_to_many or relation.one_to_many
+            model = relation.related_model
+        field = model._meta.get_field(parts[-1])
+    except FieldDoesNotExist:
+        return None
+
+    if not field.concrete or field.many_to_many:
+        return None
+
+    return RelatedPath(
+        name,
+        tuple(relations),
+        tuple(_accessor_name(relation) for relation in relations),
+        field,
+        many,
+    )
+
+
+class RenderPlan(object):
+    """The fields to show for one model, and how to name them.
+
+    The plan is computed once for each model and meta option name,
+    i.e. 'repr_fields' or 'str_fields', and is shared by proxy models
+    with their concrete model.
+    """
+
+    __slots__ = (
+        'model',
+        'meta_field_name',
+        'items',
+        'has_autofield',
+        'pk_field',
+        'drop_pk',
+        'related_fields',
+        'key_fields',
+        'fetch_related',
+        'default_predicates',
+        'max_length',
+        'max_field_length',
+        'paths',
+        'renderers',
+        '_display_paths',
+    )
+
+    def __init__(self, model, meta_field_name):
+        meta = model._meta
+        meta_fields = meta.fields
+        has_autofield = isinstance(meta_fields[0], fields.AutoField)
+
+        selected_field_names = getattr(meta, meta_field_name, _MISSING)
+        if selected_field_names is _MISSING:
+            selected_field_names = None
+            if meta.unique_together:
+                selected_field_names = next(iter(meta.unique_together))
+            elif len(meta_fields) > 1:
+                uniq_fields = [
+                    f for f in (meta_fields[1:] if has_autofield else meta_fields)
+                    if f.unique]
+                if uniq_fields:
+                    # TODO: determine which is best
+                    selected_field_names = [uniq_fields[0].name]
+
+        paths = {}
+        if selected_field_names:
+            fields_by_name = dict((f.name, f) for f in meta_fields)
+            items = []
+            for name in selected_field_names:
+                if name in fields_by_name:
+                    items.append((fields_by_name.pop(name), name))
+                elif LOOKUP_SEP in name and name not in paths:
+                    path = resolve_path(model, name)
+                    if path:
+                        paths[name] = path
+                        items.append((path.field, name))
+        elif len(meta_fields) < 3:
+            # Show 'other=Foo' instead of other_id=3
+            items = [(f, f.name) for f in meta_fields]
+        else:
+            items = [
+                (f, f.name + '_id' if isinstance(f, models.ForeignKey) else f.name)
+                for f in meta_fields]
+
+        self.model = model
+        self.meta_field_name = meta_field_name
+        self.items = tuple(items)
+        self.has_autofield = has_autofield
+        self.pk_field = meta_fields[0] if has_autofield else None
+        # The 'id' is unnecessary when the only other field is shown
+        self.drop_pk = (
+            has_autofield and len(meta_fields) == 2 and
+            bool(items) and items[0][0] is meta_fields[0])
+        # Fields of related objects, by name, e.g. 'author__name'
+        self.paths = paths
+        # Relations shown as the related object, instead of its key
+        self.related_fields = tuple(
+            f for f, name in items
+            if name == f.name and isinstance(f, models.ForeignKey))
+        # Relations shown using their key, e.g. other_id=3
+        self.key_fields = tuple(
+            f for f, name in items
+            if name == f.attname != f.name and
+            isinstance(f, models.ForeignKey))
+        # None defers to the setting FETCH_RELATED
+        self.fetch_related = getattr(meta, 'dunder_fetch_related', None)
+        # None defers to the settings MAX_LENGTH and MAX_FIELD_LENGTH
+        self.max_length = getattr(meta, 'dunder_max_length', None)
+        self.max_field_length = getattr(meta, 'dunder_max_field_length', None)
+        # Tests whether a value of each item is the default, and is hidden
+        self.default_predicates = tuple(
+            None if name in paths and paths[name].many
+            else default_predicate(f)
+            for f, name in items)
+        # Compiled functions, keyed by the settings they were built for
+        self.renderers = {}
+        self._display_paths = None
+
+    @property
+    def select_related(self):
+        """The paths to select_related() to load the related objects shown."""
+        if self._display_paths is None:
+            self._display_paths = _display_paths(self, ())
+        return self._display_paths[0]
+
+    @property
+    def prefetch_related(self):
+        """The paths to prefetch_related() to load the related fields shown."""
+        if self._display_paths is None:
+            self._display_paths = _display_paths(self, ())
+        return self._display_paths[1]
+
+    @property
+    def only(self):
+        """The paths to only() to load just the fields shown."""
+        if self._display_paths is None:
+            self._display_paths = _display_paths(self, ())
+        return self._display_paths[2]
+
+    def __repr__(self):
+        return '{}({}, {!r})'.format(
+            self.__class__.__name__, self.model._meta.label,
+            self.meta_field_name)
+
+
+def _uses_dunder(model, meta_field_name):
+    from .core import _model_repr, _model_str
+
+    if meta_field_name == 'repr_fields':
+        return model.__repr__ is _model_repr
+    return model.__str__ is _model_str
+
+
+def _display_paths(plan, seen):
+    """Return the select_related, prefetch_related and only paths of plan.
+
+    The fields of related objects are only restricted if they are shown
+    by django-dunder, and models in seen are not followed.
+    """
+    seen += (plan.model, )
+    select_related = []
+    prefetch_related = []
+    only = []
+    for field, name in plan.items:
+        path = plan.paths.get(name)
+        if path:
+            lookup = LOOKUP_SEP.join(path.accessors)
+            if path.many:
+                if lookup not in prefetch_related:
+                    prefetch_related.append(lookup)
+                first = path.relations[0]
+                if (first.concrete and not first.many_to_many and
+                        first.name not in only):
+                    # The key is needed to prefetch through the relation
+                    only.append(first.name)
+            else:
+                if lookup not in select_related:
+                    select_related.append(lookup)
+                only.append(name)
+            continue
+
+        only.append(field.name)
+        if field not in plan.related_fields:
+            continue
+
+        select_related.append(field.name)
+        related_model = field.related_model
+        if (related_model in seen or
+                not _uses_dunder(related_model, plan.meta_field_name)):
+            continue
+
+        related_plan = get_plan(related_model, plan.meta_field_name)
+        related_paths = _display_paths(related_plan, seen)
+        prefix = field.name + LOOKUP_SEP
+        for paths, related in zip(
+                (select_related, prefetch_related, only), related_paths):
+            paths.extend(prefix + path for path in related)
+
+    return tuple(select_related), tuple(prefetch_related), tuple(only)
+
+
+def _own_options(model, meta_field_name):
+    meta = model._meta
+    return (
+        getattr(meta, meta_field_name, _MISSING),
+        getattr(meta, 'dunder_fetch_related', None),
+        getattr(meta, 'dunder_max_length', None),
+        getattr(meta, 'dunder_max_field_length', None),
+    )
+
+
+def get_plan(model, meta_field_name):
+    """Return the cached RenderPlan of a model class."""
+    key = (model, meta_field_name)
+    try:
+        return _plans[key]
+    except KeyError:
+        pass
+
+    concrete_model = model._meta.concrete_model
+    if (concrete_model is not None and concrete_model is not model and
+            _own_options(model, meta_field_name) ==
+            _own_options(concrete_model, meta_field_name)):
+        plan = get_plan(concrete_model, meta_field_name)
+    else:
+        plan = RenderPlan(model, meta_field_name)
+
+    _plans[key] = plan
+    return plan
+
+
+def clear_plans(**kwargs):
+    _plans.clear()
+
+
+def _forget_plans(sender, **kwargs):
+    """Drop the plans which a new model class can change.
+
+    These are the plans of the model and the models sharing its concrete
+    model, and of the models it has relations to, which have new reverse
+    relations.  The related objects followed by the other plans are
+    recomputed, keeping their compiled renderers.
+    """
+    # Skip the historical models of migrations, which are in other registries
+    if sender._meta.apps is not global_apps:
+        return
+
+    meta = sender._meta
+    changed = set([sender, meta.concrete_model])
+    for field in list(meta.local_fields) + list(meta.local_many_to_many):
+        related_model = getattr(field, 'related_model', None)
+        # Lazy relations are resolved when the related model is prepared
+        if isinstance(related_model, type):
+            changed.add(related_model)
+    concrete_models = set(model._meta.concrete_model for model in changed)
+
+    for key in list(_plans):
+        model = key[0]
+        if model in changed or model._meta.concrete_model in concrete_models:
+            del _plans[key]
+    for plan in _plans.values():
+        plan._display_paths = None
+
+
+def _setting_changed(setting, **kwargs):
+    if setting.startswith('DUNDER_'):
+        app_settings._load()
+        clear_plans()
+
+
+class_prepared.connect(_forget_plans, dispatch_uid='django_dunder.clear_plans')
+setting_changed.connect(
+    _setting_changed, dispatch_uid='django_dunder.setting_changed')
@@ -0,0 +1,36 @@
+"""Recording of the queries issued while calling a function."""
+from django.db import connections
+
+
+class QueryRecorder(object):
+    """An execute wrapper which records the SQL of each query."""
+
+    __slots__ = ('queries', )
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+
+def call_recording_queries(func, arg):
+    """Return the result of func(arg) and the SQL of the queries it issued.
+
+    Queries are recorded on each connection supporting execute wrappers.
+    """
+    recorder = QueryRecorder()
+    wrapped = [
+        connection for connection in connections.all()
+        if hasattr(connection, 'execute_wrappers')
+    ]
+    for connection in wrapped:
+        connection.execute_wrappers.append(recorder)
+    try:
+        rv = func(arg)
+    finally:
+        for connection in wrapped:
+            connection.execute_wrappers.remove(recorder)
+
+    return rv, recorder.queries
@@ -1,6 +1,7 @@
 import sys
 import warnings
 
+from django.apps import apps as global_apps
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import Model
 from django.db.models.signals import class_prepared
@@ -9,7 +10,6 @@ from django.dispatch import receiver
 from . import app_settings
 from .core import (
     _dunder_applied_counter,
-    _model_name_counter,
     _model_repr,
     _model_str,
 )
@@ -131,10 +131,11 @@ def _patch_model_cls(model, method_name, new_func):
 
 
 def _model_cls_patcher(sender, **kwargs):
-    global _dunder_applied_counter, _model_name_counter
+    global _dunder_applied_counter
 
-    # This is used to prefix duplicated names
-    _model_name_counter[sender.__class__.__name__] += 1
+    # Skip the historical models of migrations, which are in other registries
+    if sender._meta.apps is not global_apps:
+        return
 
     if not app_settings._ANY_REGISTER:
         return
@@ -152,3 +153,28 @@ def _model_cls_patcher(sender, **kwargs):
 
 def _register_models_receiver():
     receiver(class_prepared)(_model_cls_patcher)
+
+
+def _register_existing_models(models):
+    """Patch models in one pass, and then models prepared later.
+
+    Warnings about the models are emitted as one report.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        for model in models:
+            _model_cls_patcher(model)
+
+    _register_models_receiver()
+
+    messages = []
+    for warning in caught:
+        message = str(warning.message)
+        if message not in messages:
+            messages.append(message)
+
+    if messages:
+        warnings.warn(
+            'django-dunder found {} issues while registering models:\n{}'
+            .format(len(messages), '\n'.join(
+                '- ' + message for message in messages)))
@@ -0,0 +1,233 @@
+"""Statistics of rendering, recorded when DUNDER_STATS is enabled.
+
+When disabled, the renderers are not instrumented at all.  When
+DUNDER_STATS_DIR is set, each process also appends what it recorded to
+its own file in that directory, which read_stats() merges, so that the
+dunder_stats command can show the statistics of other processes.
+"""
+import atexit
+import collections
+import functools
+import json
+import os
+import socket
+import threading
+import time
+import warnings
+
+from . import app_settings
+from ._queries import call_recording_queries
+
+try:
+    _timer = time.perf_counter
+except AttributeError:  # Python 2
+    _timer = time.time
+
+# The latest durations kept for the percentiles of each model and mode
+SAMPLES = 1000
+
+_PERCENTILES = (50, 90, 99)
+
+# Seconds between the writes of each process to DUNDER_STATS_DIR
+WRITE_INTERVAL = 10
+
+_FILE_PREFIX = 'dunder-stats-'
+
+_entries = {}
+# What was recorded since the last write to DUNDER_STATS_DIR
+_unwritten = {}
+_written = 0.0
+_lock = threading.Lock()
+
+
+class _Entry(object):
+
+    __slots__ = ('calls', 'time', 'length', 'max_length', 'queries',
+                 'samples')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.length = 0
+        self.max_length = 0
+        self.queries = 0
+        self.samples = collections.deque(maxlen=SAMPLES)
+
+    def state(self):
+        return {
+            'calls': self.calls,
+            'time': self.time,
+            'length': self.length,
+            'max_length': self.max_length,
+            'queries': self.queries,
+            'samples': list(self.samples),
+        }
+
+    def merge(self, state):
+        self.calls += state['calls']
+        self.time += state['time']
+        self.length += state['length']
+        self.max_length = max(self.max_length, state['max_length'])
+        self.queries += state['queries']
+        self.samples.extend(state['samples'])
+
+    def add(self, elapsed, length, queries):
+        self.calls += 1
+        self.time += elapsed
+        self.length += length
+        if length > self.max_length:
+            self.max_length = length
+        self.queries += queries
+        self.samples.append(elapsed)
+
+    def summary(self, model, mode):
+        samples = sorted(self.samples)
+        rv = {
+            'model': model,
+            'mode': mode,
+            'calls': self.calls,
+            'time': self.time,
+            'mean': self.time / self.calls,
+            'max': samples[-1],
+            'mean_length': self.length / float(self.calls),
+            'max_length': self.max_length,
+            'queries': self.queries,
+        }
+        for percentile in _PERCENTILES:
+            index = min(len(samples) * percentile // 100, len(samples) - 1)
+            rv['p{}'.format(percentile)] = samples[index]
+        return rv
+
+
+def _add(entries, key, elapsed, length, queries):
+    entry = entries.get(key)
+    if entry is None:
+        entry = entries[key] = _Entry()
+    entry.add(elapsed, length, queries)
+
+
+def _record(model, mode, elapsed, length, queries):
+    key = (model._meta.label, mode)
+    directory = app_settings.STATS_DIR
+    with _lock:
+        _add(_entries, key, elapsed, length, queries)
+        if not directory:
+            return
+        _add(_unwritten, key, elapsed, length, queries)
+        if time.time() - _written < WRITE_INTERVAL:
+            return
+
+    try:
+        write_stats(directory)
+    except EnvironmentError as e:
+        warnings.warn(
+            'django-dunder statistics could not be written to {}: {}'.format(
+                directory, e))
+
+
+def instrument(render, mode):
+    """Return render wrapped to record its statistics as mode."""
+    @functools.wraps(render)
+    def instrumented(self):
+        start = _timer()
+        rv, queries = call_recording_queries(render, self)
+        elapsed = _timer() - start
+
+        _record(self.__class__, mode, elapsed, len(rv), len(queries))
+        return rv
+
+    return instrumented
+
+
+def _summaries(entries):
+    rv = [
+        entry.summary(model, mode)
+        for (model, mode), entry in entries.items()
+    ]
+    rv.sort(key=lambda item: item['time'], reverse=True)
+    return rv
+
+
+def stats(reset=False):
+    """Return the statistics of each model and mode, slowest first.
+
+    Each is a dict with the 'model' label, the 'mode', the number of
+    'calls', the total 'time' and the 'mean', 'p50', 'p90', 'p99' and
+    'max' durations in seconds, the 'mean_length' and 'max_length' of the
+    output, and the number of 'queries'.  Only the statistics of the
+    current process are returned; see read_stats() for the others.
+    """
+    with _lock:
+        rv = _summaries(_entries)
+        if reset:
+            _entries.clear()
+    return rv
+
+
+def _stats_path(directory):
+    return os.path.join(directory, '{}{}-{}.jsonl'.format(
+        _FILE_PREFIX, socket.gethostname(), os.getpid()))
+
+
+def write_stats(directory):
+    """Append what this process recorded since the last write to its file.
+
+    Each write is one line of JSON, so that the file is only appended to.
+    """
+    global _written
+
+    with _lock:
+        _written = time.time()
+        if not _unwritten:
+            return
+        line = json.dumps([
+            [model, mode, entry.state()]
+            for (model, mode), entry in _unwritten.items()
+        ])
+        _unwritten.clear()
+
+    with open(_stats_path(directory), 'a') as f:
+        f.write(line + '\n')
+
+
+def read_stats(directory, reset=False):
+    """Return the statistics written to directory by all the processes.
+
+    They are merged and returned like stats(), and the files are removed
+    if reset.
+    """
+    entries = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.startswith(_FILE_PREFIX):
+            continue
+        path = os.path.join(directory, name)
+        with open(path) as f:
+            lines = f.readlines()
+        if reset:
+            os.remove(path)
+
+        for line in lines:
+            try:
+                items = json.loads(line)
+            except ValueError:  # Still being written
+                continue
+            for model, mode, state in items:
+                key = (model, mode)
+                entry = entries.get(key)
+                if entry is None:
+                    entry = entries[key] = _Entry()
+                entry.merge(state)
+
+    return _summaries(entries)
+
+
+def _write_at_exit():
+    directory = app_settings.STATS_DIR
+    if directory and _unwritten:
+        try:
+            write_stats(directory)
+        except EnvironmentError:
+            pass
+
+
+atexit.register(_write_at_exit)
@@ -0,0 +1,126 @@
+from django.db.models.query import QuerySet
+
+try:
+    from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+except ImportError:  # Django < 2.0
+    AutocompleteJsonView = None
+
+from ._plan import _uses_dunder, get_plan
+from .bulk import render_choices, renders_rows
+
+__all__ = [
+    'DunderAdminMixin',
+    'DunderAutocompleteMixin',
+]
+
+_changelists = {}
+
+# Django 4.0 added serialize_result, before which get() uses object_list
+_SERIALIZE_RESULT = hasattr(AutocompleteJsonView, 'serialize_result')
+
+
+class DunderChangeListMixin(object):
+    """Load only the fields shown when the rows only show their str.
+
+    Only the rows displayed are restricted, and the queryset given to
+    actions loads all the fields.
+    """
+
+    def get_results(self, request):
+        queryset = self.queryset
+
+        columns = [
+            name for name in self.list_display if name != 'action_checkbox']
+        if (columns == ['__str__'] and not self.list_editable and
+                _uses_dunder(self.model, 'str_fields')):
+            self.queryset = queryset.only(
+                *get_plan(self.model, 'str_fields').only)
+
+        try:
+            super(DunderChangeListMixin, self).get_results(request)
+        finally:
+            self.queryset = queryset
+
+
+class DunderAdminMixin(object):
+    """ModelAdmin mixin loading what the str of each object needs.
+
+    The related objects shown are loaded using select_related(), or
+    prefetch_related() when there are many, and when the changelist only
+    shows the str of each row, only the fields shown are loaded.
+    Models with their own __str__ are loaded as by ModelAdmin.
+    """
+
+    def get_queryset(self, request):
+        queryset = super(DunderAdminMixin, self).get_queryset(request)
+        if not _uses_dunder(self.model, 'str_fields'):
+            return queryset
+
+        plan = get_plan(self.model, 'str_fields')
+        if plan.select_related:
+            queryset = queryset.select_related(*plan.select_related)
+        if plan.prefetch_related:
+            queryset = queryset.prefetch_related(*plan.prefetch_related)
+
+        return queryset
+
+    def get_changelist(self, request, **kwargs):
+        base = super(DunderAdminMixin, self).get_changelist(request, **kwargs)
+        try:
+            return _changelists[base]
+        except KeyError:
+            pass
+
+        changelist = type(
+            str('Dunder' + base.__name__), (DunderChangeListMixin, base), {})
+        _changelists[base] = changelist
+        return changelist
+
+
+class _Result(object):
+
+    __slots__ = ('value', 'text')
+
+    def __init__(self, value, text):
+        self.value = value
+        self.text = text
+
+
+class DunderAutocompleteMixin(object):
+    """AutocompleteJsonView mixin rendering the results without instances.
+
+    The results of each page are the str() of the rows, rendered with one
+    values_list() query of the columns shown.  Instances are used when the
+    model does not use django-dunder, or serialize_result is customised.
+    Requires Django 4.0 or later, and does nothing on earlier versions.
+    """
+
+    def process_request(self, request):
+        rv = super(DunderAutocompleteMixin, self).process_request(request)
+        self.dunder_to_field_name = rv[3]
+        return rv
+
+    def get_context_data(self, **kwargs):
+        context = super(DunderAutocompleteMixin, self).get_context_data(
+            **kwargs)
+
+        object_list = context['object_list']
+        to_field_name = getattr(self, 'dunder_to_field_name', None)
+        if (_SERIALIZE_RESULT and
+                to_field_name and
+                isinstance(object_list, QuerySet) and
+                type(self).serialize_result is
+                DunderAutocompleteMixin.serialize_result and
+                renders_rows(object_list)):
+            context['object_list'] = [
+                _Result(value, text)
+                for value, text in render_choices(object_list, to_field_name)
+            ]
+
+        return context
+
+    def serialize_result(self, obj, to_field_name):
+        if isinstance(obj, _Result):
+            return {'id': str(obj.value), 'text': obj.text}
+        return super(DunderAutocompleteMixin, self).serialize_result(
+            obj, to_field_name)
@@ -1,7 +1,14 @@
+import fnmatch
+import re
+
 from django.conf import settings as django_settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
+from ._formatter import FormattableObjectWrapper, compile_attr_fmt
+
+GUARD_MODES = ('warn', 'raise', 'record')
+
 
 def get_setting_safe(name, default):
     try:
@@ -32,64 +39,188 @@ class _AlwaysContains(object):
     __str__ = __repr__
 
 
+_GLOB_CHARS = frozenset('*?[')
+
+
+class _LabelMatcher(object):
+    """Matches model labels against a list of labels and patterns.
+
+    Items containing '*', '?' or '[' are glob patterns, e.g. 'auth.*',
+    and items starting with '^' or compiled with re.compile are regular
+    expressions matched from the start of the label.
+    The patterns are combined into one regular expression, and the result
+    for each label is cached.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+        labels = set()
+        patterns = []
+        for item in self.items:
+            if hasattr(item, 'pattern'):
+                patterns.append(item.pattern)
+            elif item.startswith('^'):
+                patterns.append(item)
+            elif _GLOB_CHARS.intersection(item):
+                patterns.append(fnmatch.translate(item))
+            else:
+                labels.add(item)
+
+        self.labels = frozenset(labels)
+        self.regex = None
+        if patterns:
+            self.regex = re.compile('|'.join(
+                '(?:{})'.format(pattern) for pattern in patterns))
+        self._cache = {}
+
+    def __contains__(self, label):
+        try:
+            return self._cache[label]
+        except KeyError:
+            pass
+
+        matched = label in self.labels or bool(
+            self.regex and self.regex.match(label))
+        self._cache[label] = matched
+        return matched
+
+    def __bool__(self):
+        return bool(self.items)
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        if isinstance(other, _LabelMatcher):
+            other = other.items
+        return self.items == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.items)
+
+    __str__ = __repr__
+
+
+def _labels(value):
+    """Return a bool setting or a list of labels in a form for `in`."""
+    if isinstance(value, bool):
+        return _AlwaysContains(value)
+    if isinstance(value, (list, tuple)):
+        return _LabelMatcher(value)
+    return value
+
+
 def _post_process():
     global FORCE_REPR, FORCE_STR, REPR_EXCLUDE, STR_EXCLUDE, _ANY_REGISTER
     global WRAPPER_CLASS
 
-    if isinstance(FORCE_REPR, list) and isinstance(FORCE, list):
-        FORCE_REPR += FORCE
-    elif isinstance(FORCE_REPR, bool):
-        FORCE_REPR = _AlwaysContains(FORCE_REPR)
+    if isinstance(FORCE_REPR, (list, tuple)) and isinstance(FORCE, list):
+        FORCE_REPR = list(FORCE_REPR) + FORCE
+    FORCE_REPR = _labels(FORCE_REPR)
 
-    if isinstance(FORCE_STR, list) and isinstance(FORCE, list):
-        FORCE_STR += FORCE
-    elif isinstance(FORCE_STR, bool):
-        FORCE_STR = _AlwaysContains(FORCE_STR)
+    if isinstance(FORCE_STR, (list, tuple)) and isinstance(FORCE, list):
+        FORCE_STR = list(FORCE_STR) + FORCE
+    FORCE_STR = _labels(FORCE_STR)
 
     _ANY_REGISTER = (
         WARN_UNICODE or COPY_UNICODE or REJECT_UNICODE or
         AUTO or AUTO_REPR or AUTO_STR or FORCE or FORCE_REPR or FORCE_STR)
 
-    if isinstance(REPR_EXCLUDE, bool):
-        REPR_EXCLUDE = _AlwaysContains(REPR_EXCLUDE)
+    REPR_EXCLUDE = _labels(REPR_EXCLUDE)
+    STR_EXCLUDE = _labels(STR_EXCLUDE)
 
-    if isinstance(STR_EXCLUDE, bool):
-        STR_EXCLUDE = _AlwaysContains(STR_EXCLUDE)
+    if QUERY_GUARD and QUERY_GUARD not in GUARD_MODES:
+        raise ImproperlyConfigured(
+            'DUNDER_QUERY_GUARD {!r} is not one of {}'.format(
+                QUERY_GUARD, ', '.join(GUARD_MODES)))
 
     if isinstance(WRAPPER_CLASS, str):
         WRAPPER_CLASS = import_string(WRAPPER_CLASS)
 
-AUTO = get_setting_safe('AUTO', True)
+    if WRAPPER_CLASS is FormattableObjectWrapper:
+        # Parse the modifier chains once
+        compile_attr_fmt(REPR_ATTR_FMT)
+        compile_attr_fmt(STR_ATTR_FMT)
+
+
+def _load():
+    """(Re)load all settings from the Django settings."""
+    global AUTO, AUTO_REPR, AUTO_STR, FORCE, FORCE_REPR, FORCE_STR
+    global REPR_EXCLUDE, STR_EXCLUDE, WARN_UNICODE, COPY_UNICODE
+    global REJECT_UNICODE, CHECK_INACTIVE_UNICODE
+    global REPR_ATTR_FMT, STR_ATTR_FMT, REPR_FMT, STR_FMT, WRAPPER_CLASS
+    global SKIP_DEFERRED, DEFERRED_PLACEHOLDER, FETCH_RELATED
+    global MAX_LENGTH, MAX_FIELD_LENGTH, MAX_DEPTH, MAX_ITEMS, MAX_STRING
+    global REGISTER_AT_READY, STATS, STATS_DIR, QUERY_GUARD
+
+    AUTO = get_setting_safe('AUTO', True)
+
+    AUTO_REPR = get_setting_safe('AUTO_REPR', AUTO)
+    AUTO_STR = get_setting_safe('AUTO_STR', AUTO)
+
+    FORCE = get_setting_safe('FORCE', False)
+
+    FORCE_REPR = get_setting_safe('FORCE_REPR', FORCE)
+    FORCE_STR = get_setting_safe('FORCE_STR', FORCE)
+
+    REPR_EXCLUDE = get_setting_safe('REPR_EXCLUDE', False)
+    STR_EXCLUDE = get_setting_safe('STR_EXCLUDE', False)
+
+    # Register all models in one pass once the app registry is ready,
+    # instead of as each model class is prepared
+    REGISTER_AT_READY = get_setting_safe('REGISTER_AT_READY', False)
+
+    WARN_UNICODE = get_setting_safe('WARN_UNICODE', True)
+
+    # Only in effect on Python 3
+    # Could be a list
+    COPY_UNICODE = get_setting_safe('COPY_UNICODE', AUTO_STR)
+
+    REJECT_UNICODE = get_setting_safe('REJECT_UNICODE',
+        not django_settings.DEBUG and not COPY_UNICODE)
+
+    CHECK_INACTIVE_UNICODE = get_setting_safe(
+        'CHECK_INACTIVE_UNICODE', 'error' if not COPY_UNICODE or REJECT_UNICODE else 'warn')
 
-AUTO_REPR = get_setting_safe('AUTO_REPR', AUTO)
-AUTO_STR = get_setting_safe('AUTO_STR', AUTO)
+    REPR_ATTR_FMT = get_setting_safe('REPR_ATTR_FMT', '{name}={value!r}')
+    STR_ATTR_FMT = get_setting_safe('STR_ATTR_FMT', '{name}={value}')
 
-FORCE = get_setting_safe('FORCE', False)
+    REPR_FMT = get_setting_safe('REPR_FMT', '{}({})')
+    STR_FMT = get_setting_safe('STR_FMT', '<{}: {}>')
 
-FORCE_REPR = get_setting_safe('FORCE_REPR', FORCE)
-FORCE_STR = get_setting_safe('FORCE_STR', FORCE)
+    WRAPPER_CLASS = get_setting_safe('WRAPPER_CLASS', 'django_dunder._formatter.FormattableObjectWrapper')
 
-REPR_EXCLUDE = get_setting_safe('REPR_EXCLUDE', False)
-STR_EXCLUDE = get_setting_safe('STR_EXCLUDE', False)
+    # Avoid loading deferred fields, which needs a query for each field
+    SKIP_DEFERRED = get_setting_safe('SKIP_DEFERRED', not django_settings.DEBUG)
+    # None hides deferred fields, otherwise the value shown for them
+    DEFERRED_PLACEHOLDER = get_setting_safe('DEFERRED_PLACEHOLDER', None)
 
-WARN_UNICODE = get_setting_safe('WARN_UNICODE', True)
+    # Fetch related objects which are not cached on the instance,
+    # instead of showing their primary key.  Also Meta.dunder_fetch_related
+    FETCH_RELATED = get_setting_safe('FETCH_RELATED', False)
 
-# Only in effect on Python 3
-# Could be a list
-COPY_UNICODE = get_setting_safe('COPY_UNICODE', AUTO_STR)
+    # Approximate limits of the text of all fields, and of each field.
+    # Also Meta.dunder_max_length and Meta.dunder_max_field_length
+    MAX_LENGTH = get_setting_safe('MAX_LENGTH', None)
+    MAX_FIELD_LENGTH = get_setting_safe('MAX_FIELD_LENGTH', None)
 
-REJECT_UNICODE = get_setting_safe('REJECT_UNICODE',
-    not django_settings.DEBUG and not COPY_UNICODE)
+    # Limits of the containers in JSONField, ArrayField and HStoreField
+    # values: nesting depth, items shown of each, and length of str items
+    MAX_DEPTH = get_setting_safe('MAX_DEPTH', 6)
+    MAX_ITEMS = get_setting_safe('MAX_ITEMS', 100)
+    MAX_STRING = get_setting_safe('MAX_STRING', None)
 
-CHECK_INACTIVE_UNICODE = get_setting_safe(
-    'CHECK_INACTIVE_UNICODE', 'error' if not COPY_UNICODE or REJECT_UNICODE else 'warn')
+    # Record statistics of each render, see django_dunder.stats()
+    STATS = get_setting_safe('STATS', False)
+    # Directory each process writes its statistics to, for dunder_stats
+    STATS_DIR = get_setting_safe('STATS_DIR', None)
 
-REPR_ATTR_FMT = get_setting_safe('REPR_ATTR_FMT', '{name}={value!r}')
-STR_ATTR_FMT = get_setting_safe('STR_ATTR_FMT', '{name}={value}')
+    # Detect queries issued while rendering: 'warn', 'raise' or 'record'
+    QUERY_GUARD = get_setting_safe('QUERY_GUARD', False)
 
-REPR_FMT = get_setting_safe('REPR_FMT', '{}({})')
-STR_FMT = get_setting_safe('STR_FMT', '<{}: {}>')
+    _post_process()
 
-WRAPPER_CLASS = get_setting_safe('WRAPPER_CLASS', 'django_dunder._formatter.FormattableObjectWrapper')
 
-_post_process()
+_load()
@@ -1,7 +1,9 @@
 from django.apps import AppConfig
 from django.utils.translation import gettext_lazy as _
 
-from .app_settings import _ANY_REGISTER
+from django.apps import apps
+
+from .app_settings import _ANY_REGISTER, REGISTER_AT_READY
 
 
 class DunderConfig(AppConfig):
@@ -16,6 +18,11 @@ class DunderConfig(AppConfig):
         if _ANY_REGISTER:
             import django_dunder._register  # noqa
 
+            if REGISTER_AT_READY:
+                from ._register import _register_existing_models
+                _register_existing_models(apps.get_models(
+                    include_auto_created=True, include_swapped=True))
+
         from .checks import check_py2_unicode  # noqa
 
     def get_models(self, *args, **kwargs):
@@ -0,0 +1,165 @@
+from .core import RelatedId, _get_mode, _model_name, get_renderer
+from ._fields import stores_value
+from ._load import _fetch_related, load
+from ._plan import _uses_dunder, get_plan
+
+__all__ = [
+    'render_choices',
+    'render_instances',
+    'render_queryset',
+    'renders_rows',
+]
+
+
+_BUILTINS = {
+    'repr_fields': repr,
+    'str_fields': str,
+}
+
+
+def _related_id(value):
+    if value is None:
+        return None
+    return RelatedId(value)
+
+
+def _instance_only_names(plan):
+    """Return the names shown by plan which need instances to render.
+
+    These are the fields of many related objects, and the fields whose
+    descriptor changes the value, e.g. FileField, as rows only have the
+    value stored.
+    """
+    names = []
+    for field, name in plan.items:
+        path = plan.paths.get(name)
+        if path is None:
+            model = plan.model
+        elif path.many:
+            names.append(name)
+            continue
+        else:
+            model = path.relations[-1].related_model
+        if not stores_value(model, field):
+            names.append(name)
+    return sorted(names)
+
+
+def renders_rows(queryset, mode='str'):
+    """Return whether the rows of queryset render like its instances.
+
+    This is the case when the model uses django-dunder for mode, and
+    neither the queryset nor what is shown needs many related objects.
+    Instances show the related objects shown when they are fetched, and
+    do not show the fields of related objects when they are not.
+    """
+    meta_field_name = _get_mode(mode)[0]
+    if not _uses_dunder(queryset.model, meta_field_name):
+        return False
+    if queryset._prefetch_related_lookups:
+        return False
+    plan = get_plan(queryset.model, meta_field_name)
+    if _instance_only_names(plan):
+        return False
+    if _fetch_related(plan):
+        return not plan.related_fields
+    return not plan.paths
+
+
+def _row_renderer(queryset, mode, names):
+    """Return the values_list() of queryset, and a function rendering rows.
+
+    The function returns the values of names and the rendering of a row.
+    """
+    model = queryset.model
+    if not _uses_dunder(model, _get_mode(mode)[0]):
+        raise ValueError(
+            '{} does not use django-dunder for {}, and can not be rendered '
+            'without instances'.format(model._meta.label, mode))
+
+    renderer = get_renderer(model, mode, fetch_related=False)
+    plan = renderer.plan
+    instance_only = _instance_only_names(plan)
+    if instance_only:
+        raise ValueError('{} can not be rendered without instances'.format(
+            ', '.join(instance_only)))
+
+    related_fields = plan.related_fields
+    offset = len(names)
+    related_positions = [
+        offset + i for i, field in enumerate(renderer.fields)
+        if field in related_fields]
+
+    emit = renderer.emit
+    model_name = _model_name(model)
+
+    def render_row(row):
+        if related_positions:
+            row = list(row)
+            for i in related_positions:
+                row[i] = _related_id(row[i])
+        return row[:offset], emit(model_name, *row[offset:])
+
+    rows = queryset.values_list(*(tuple(names) + renderer.columns))
+    return rows, render_row
+
+
+def _render_rows(queryset, mode, names):
+    """Yield the values of names and the rendering of each row."""
+    rows, render_row = _row_renderer(queryset, mode, names)
+    for row in rows.iterator():
+        yield render_row(row)
+
+
+def render_queryset(queryset, mode='str'):
+    """Yield the str or repr of each row of queryset, without instances.
+
+    Only the columns which are shown are selected, using one values_list()
+    query.  Related objects are shown using their key, e.g. author_id=1,
+    and fields of related objects such as author__name are joined.
+    ValueError is raised for models which do not use django-dunder for
+    mode, fields of many related objects, and fields whose descriptor
+    changes the value, e.g. FileField, as they can not be rendered
+    without instances.
+    """
+    for values, text in _render_rows(queryset, mode, ()):
+        yield text
+
+
+def render_choices(queryset, value_name='pk', mode='str'):
+    """Yield the value_name and str of each row, like render_queryset.
+
+    This provides the choices of a select, with value_name being the pk
+    or another field, without instances.
+    """
+    for values, text in _render_rows(queryset, mode, (value_name, )):
+        yield values[0], text
+
+
+def render_instances(instances, mode='str', fetch_related=True):
+    """Return the str or repr of each of instances, as a list.
+
+    The related objects shown are loaded first, using one query for each
+    model referenced by foreign keys, and one for each other relation,
+    so that the number of queries does not depend on the number of
+    instances.  Deferred fields are loaded the same way, unless skipped.
+    fetch_related=None uses the settings of each model to decide whether
+    related objects which are not loaded are fetched.
+    """
+    meta_field_name = _get_mode(mode)[0]
+    instances = list(instances)
+    load(instances, mode, fetch_related)
+
+    renderers = {}
+    rv = []
+    for instance in instances:
+        cls = instance.__class__
+        render = renderers.get(cls)
+        if render is None:
+            if _uses_dunder(cls, meta_field_name):
+                render = get_renderer(cls, mode, fetch_related)
+            else:
+                render = _BUILTINS[meta_field_name]
+            renderers[cls] = render
+        rv.append(render(instance))
+    return rv
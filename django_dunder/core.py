@@ -1,128 +1,366 @@
-import collections
 import functools
+import weakref
 
-from django.db import models
-from django.db.models import fields
+from django.apps import apps as global_apps
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import class_prepared
 
 from . import app_settings
 
-from ._formatter import FormattableObjectWrapper
+from ._codegen import compile_renderer
+from ._fields import default_predicate
+from ._formatter import ContainerRepr
+from ._plan import get_plan
 
-_model_name_counter = collections.Counter()
 _dunder_applied_counter = 0
 
+_MODES = {
+    'repr': ('repr_fields', 'REPR_FMT', 'REPR_ATTR_FMT'),
+    'str': ('str_fields', 'STR_FMT', 'STR_ATTR_FMT'),
+}
+
 
 def field_value(model, field):
+    """Return the value of field, or None if it is the default or empty."""
     value = getattr(model, field.name)
+    if not value:
+        return None
 
-    default = field.default
-    if value == default:
+    is_default = default_predicate(field)
+    if is_default and is_default(value):
         return None
-    elif default is models.NOT_PROVIDED:
-        if isinstance(field, models.CharField) and value == '':
-            return None
 
     return value
 
 
-def _format_field(model, field, fmt=None, wrap=True):
-    """Obtain either "bar_id=9" or "bar='bar_value'" str.
+def _get_attr(model, field):
+    return getattr(model, field.name)
+
+
+def _get_attname(model, field):
+    return getattr(model, field.attname)
+
+
+class DeferredValue(object):
+    """Shown in place of the value of a field which was not loaded."""
+
+    __slots__ = ('text', )
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return self.text
+
+    __str__ = __repr__
+
+
+def loaded_field_value(model, field, placeholder=None,
+                       value_getter=_get_attr):
+    """Obtain the field value, without loading deferred fields."""
+    if field.attname not in model.__dict__:
+        return placeholder
+
+    return value_getter(model, field)
+
+
+class RelatedId(object):
+    """The key of a related object which was not loaded."""
+
+    __slots__ = ('value', )
+
+    def __init__(self, value):
+        self.value = value
+
+    def __bool__(self):
+        return bool(self.value)
 
-    field is a Django Field object.
+    __nonzero__ = __bool__
+
+
+def _is_cached(field, model):
+    try:
+        return field.is_cached(model)
+    except AttributeError:  # Django < 2.0
+        return hasattr(model, field.get_cache_name())
+
+
+def cached_related_value(model, field, value_getter=_get_attr):
+    """Obtain the related object if it was loaded, otherwise its RelatedId."""
+    if field.attname not in model.__dict__ or _is_cached(field, model):
+        return value_getter(model, field)
+
+    value = model.__dict__[field.attname]
+    if value is None:
+        return None
+
+    return RelatedId(value)
+
+
+def _related_objects(model, relation, accessor, fetch):
+    """Return the objects related to model, or None if not loaded."""
+    if relation.many_to_many or relation.one_to_many:
+        # The manager of an unsaved instance can not be used
+        if model.pk is None:
+            return None
+        # A prefetched queryset already has its results
+        queryset = getattr(model, accessor).all()
+        if queryset._result_cache is None and not fetch:
+            return None
+        return list(queryset)
+
+    if not fetch and not _is_cached(relation, model):
+        return None
+
+    try:
+        related = getattr(model, accessor)
+    except ObjectDoesNotExist:  # The reverse of a one-to-one relation
+        return []
+
+    return [] if related is None else [related]
+
+
+def cached_path_value(model, path, fetch=False, value_getter=_get_attr,
+                      key_getter=_get_attname):
+    """Obtain the value of a RelatedPath from the loaded related objects.
+
+    None is returned when a related object was not loaded, unless fetch.
+    The value of a path which follows a many-valued relation is a list.
     """
-    if isinstance(field, models.ForeignKey):
-        field_name = field.name + '_id'
+    objs = [model]
+    for relation, accessor in zip(path.relations, path.accessors):
+        related = []
+        for obj in objs:
+            obj_related = _related_objects(obj, relation, accessor, fetch)
+            if obj_related is None:
+                return None
+            related.extend(obj_related)
+        objs = related
+
+    field = path.field
+    if field.is_relation and not fetch:
+        values = [
+            value_getter(obj, field) if _is_cached(field, obj)
+            else key_getter(obj, field)
+            for obj in objs]
     else:
-        field_name = field.name
-    return _format_field_raw(model, field, field_name, fmt=fmt, wrap=wrap)
+        values = [value_getter(obj, field) for obj in objs]
 
+    if path.many:
+        return values
+    return values[0] if values else None
 
-def _format_field_raw(model, field, field_name=None, fmt=None, wrap=True):
-    """Obtain "bar='bar_value'" str.
 
-    field is a Django Field object.
-    field_name is either field.name or field.name + '_id'
+def _get_placeholder():
+    placeholder = app_settings.DEFERRED_PLACEHOLDER
+    if placeholder is not None:
+        placeholder = DeferredValue(placeholder)
+    return placeholder
+
+
+def _get_value_getter(value_getter=_get_attr):
+    if not app_settings.SKIP_DEFERRED:
+        return value_getter
+
+    return functools.partial(
+        loaded_field_value,
+        placeholder=_get_placeholder(),
+        value_getter=value_getter,
+    )
+
+
+def _get_container_repr():
+    limits = (
+        app_settings.MAX_DEPTH,
+        app_settings.MAX_ITEMS,
+        app_settings.MAX_STRING,
+    )
+    if limits == (None, None, None):
+        return None
+    return ContainerRepr(*limits)
+
+
+class ModelNames(object):
+    """The names shown for model classes.
+
+    A model is shown using its label when another live class with the same
+    __name__ has been added, otherwise using its __name__.  Classes are
+    held by weak references, so that classes created dynamically are
+    released, and the name of each class is computed once.
     """
-    if not fmt:
-        fmt = app_settings.STR_ATTR_FMT
 
-    value = field_value(model, field)
-    if not value:
-        return ''
-
-    if wrap:
-        value = app_settings.WRAPPER_CLASS(value)
-
-    return fmt.format(name=field_name or field.name, value=value)
-
-
-def _to_string(model, meta_field_name, instance_fmt, field_fmt, wrap=False):
-	
-    self = model
-    fmt = field_fmt
-    cls = type(self)
-    meta_fields = cls._meta.fields
-    has_autofield = isinstance(meta_fields[0], fields.AutoField)
-    selected_field_names = None
-    if hasattr(cls._meta, meta_field_name):
-        selected_field_names = getattr(cls._meta, meta_field_name)
-    elif cls._meta.unique_together:
-        selected_field_names = next(iter(cls._meta.unique_together))
-    elif len(meta_fields) > 1:
-        uniq_fields = [f for f in (meta_fields[1:] if has_autofield else meta_fields) if f.unique]
-        if uniq_fields:
-            # TODO: determine which is best
-            selected_field_names = [uniq_fields[0].name]
-
-    if selected_field_names:
-        meta_fields_filtered = [f for f in meta_fields if f.name in selected_field_names]
-        meta_fields_filtered.sort(key=lambda f: selected_field_names.index(f.name))
-
-        func = functools.partial(_format_field_raw, self, fmt=fmt, wrap=wrap)
-        parts = filter(None, map(func, meta_fields_filtered))
-    elif len(meta_fields) < 3:
-        # _raw shows 'other=Foo' instead of other_id=3
-        func = functools.partial(_format_field_raw, self, fmt=fmt, wrap=wrap)
-        parts = filter(None, map(func, meta_fields))
-    else:
-        func = functools.partial(_format_field, self, fmt=fmt, wrap=wrap)
-        parts = filter(None, map(func, meta_fields))
+    def __init__(self):
+        # __name__ -> {id(cls): weakref of cls}
+        self._classes = {}
+        self._names = weakref.WeakKeyDictionary()
 
-    parts = list(parts)
+    def add(self, cls):
+        name = cls.__name__
+        classes = self._classes.setdefault(name, {})
+        ref = classes.get(id(cls))
+        if ref is not None and ref() is cls:
+            return
 
-    if has_autofield and len(meta_fields) == 2 and len(parts) == 2:
-        # Ignore unnecessary 'id'
-        parts = [parts[1]]
+        classes[id(cls)] = weakref.ref(
+            cls, functools.partial(self._discard, name, id(cls)))
+        self._forget(classes)
 
-    attrs = ', '.join(parts)
+    def _discard(self, name, key, ref):
+        classes = self._classes.get(name)
+        if classes is None or classes.get(key) is not ref:
+            return
 
-    if not attrs and has_autofield:
-        attrs = _format_field_raw(self, meta_fields[0], fmt=fmt, wrap=wrap)
+        del classes[key]
+        if classes:
+            self._forget(classes)
+        else:
+            del self._classes[name]
 
-    if _model_name_counter[cls.__name__] > 1:
-        model_name = cls._meta.label
-    else:
-        model_name = cls.__name__
+    def _forget(self, classes):
+        for ref in list(classes.values()):
+            cls = ref()
+            if cls is not None:
+                self._names.pop(cls, None)
 
-    rv = instance_fmt.format(model_name, attrs)
-    return rv
+    def __getitem__(self, cls):
+        try:
+            return self._names[cls]
+        except KeyError:
+            pass
 
+        self.add(cls)
+        if len(self._classes[cls.__name__]) > 1:
+            name = cls._meta.label
+        else:
+            name = cls.__name__
+        self._names[cls] = name
+        return name
 
-def _model_repr(self):
-    return _to_string(
-        model=self,
-        meta_field_name='repr_fields',
-        instance_fmt=app_settings.REPR_FMT,
-        field_fmt=app_settings.REPR_ATTR_FMT,
-        wrap=True,
+    def __len__(self):
+        return len(self._classes)
+
+
+_model_names = ModelNames()
+
+
+def _add_model_name(sender, **kwargs):
+    # Skip the historical models of migrations, which are in other registries
+    if sender._meta.apps is global_apps:
+        _model_names.add(sender)
+
+
+class_prepared.connect(
+    _add_model_name, dispatch_uid='django_dunder.model_names')
+
+
+def _model_name(cls):
+    return _model_names[cls]
+
+
+def _get_renderer(cls, meta_field_name, instance_fmt, field_fmt,
+                  fetch_related=None):
+    """Return the compiled rendering function for a model class."""
+    plan = get_plan(cls, meta_field_name)
+    wrapper = app_settings.WRAPPER_CLASS
+    if fetch_related is None:
+        fetch_related = plan.fetch_related
+    if fetch_related is None:
+        fetch_related = app_settings.FETCH_RELATED
+    max_length = plan.max_length
+    if max_length is None:
+        max_length = app_settings.MAX_LENGTH
+    max_field_length = plan.max_field_length
+    if max_field_length is None:
+        max_field_length = app_settings.MAX_FIELD_LENGTH
+    key = (
+        instance_fmt,
+        field_fmt,
+        wrapper,
+        app_settings.SKIP_DEFERRED,
+        app_settings.DEFERRED_PLACEHOLDER,
+        fetch_related,
+        max_length,
+        max_field_length,
+        app_settings.MAX_DEPTH,
+        app_settings.MAX_ITEMS,
+        app_settings.MAX_STRING,
+        app_settings.STATS,
+        app_settings.QUERY_GUARD,
     )
+    try:
+        return plan.renderers[key]
+    except KeyError:
+        pass
 
+    value_getter = _get_value_getter()
+    key_getter = _get_value_getter(_get_attname)
+    related_getter = None
+    if not fetch_related:
+        related_getter = functools.partial(
+            cached_related_value, value_getter=value_getter)
+    path_getter = functools.partial(
+        cached_path_value, fetch=fetch_related, value_getter=value_getter,
+        key_getter=key_getter)
 
-def _model_str(self):
-    return _to_string(
-        model=self,
-        meta_field_name='str_fields',
-        instance_fmt=app_settings.STR_FMT,
-        field_fmt=app_settings.STR_ATTR_FMT,
-        wrap=True,
+    renderer = compile_renderer(
+        plan, instance_fmt, field_fmt, wrapper,
+        model_name_getter=_model_names.__getitem__,
+        skip_deferred=app_settings.SKIP_DEFERRED,
+        placeholder=_get_placeholder(),
+        value_getter=value_getter,
+        key_getter=key_getter,
+        related_getter=related_getter,
+        path_getter=path_getter,
+        related_id_class=RelatedId,
+        max_field_length=max_field_length,
+        max_length=max_length,
+        container_repr=_get_container_repr(),
     )
+    mode = meta_field_name.split('_')[0]
+    if app_settings.QUERY_GUARD:
+        from ._guard import guard
+        renderer = guard(renderer, mode, app_settings.QUERY_GUARD)
+    if app_settings.STATS:
+        from ._stats import instrument
+        renderer = instrument(renderer, mode)
+    plan.renderers[key] = renderer
+    return renderer
+
+
+def _get_mode(mode):
+    try:
+        return _MODES[mode]
+    except KeyError:
+        raise ValueError(
+            'mode {!r} is not one of {}'.format(mode, ', '.join(sorted(_MODES))))
+
+
+def get_renderer(cls, mode, fetch_related=None):
+    """Return the compiled rendering function for mode 'repr' or 'str'."""
+    meta_field_name, instance_fmt_name, field_fmt_name = _get_mode(mode)
+
+    return _get_renderer(
+        cls,
+        meta_field_name,
+        getattr(app_settings, instance_fmt_name),
+        getattr(app_settings, field_fmt_name),
+        fetch_related=fetch_related,
+    )
+
+
+def _model_repr(self):
+    return _get_renderer(
+        self.__class__,
+        'repr_fields',
+        app_settings.REPR_FMT,
+        app_settings.REPR_ATTR_FMT,
+    )(self)
+
+
+def _model_str(self):
+    return _get_renderer(
+        self.__class__,
+        'str_fields',
+        app_settings.STR_FMT,
+        app_settings.STR_ATTR_FMT,
+    )(self)
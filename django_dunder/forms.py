@@ -0,0 +1,76 @@
+"""Model choice fields rendering their labels without model instances."""
+from django import forms
+from django.forms.models import ModelChoiceIterator
+
+try:
+    from django.forms.models import ModelChoiceIteratorValue
+except ImportError:  # Django < 3.1
+    ModelChoiceIteratorValue = None
+
+from .bulk import render_choices, renders_rows
+
+__all__ = [
+    'DunderModelChoiceField',
+    'DunderModelChoiceIterator',
+    'DunderModelMultipleChoiceField',
+]
+
+
+def _function(method):
+    return getattr(method, '__func__', method)
+
+
+_label_from_instance = _function(forms.ModelChoiceField.label_from_instance)
+
+
+def value_column(model, to_field_name=None):
+    """Return the column of the values of the choices."""
+    if not to_field_name:
+        return 'pk'
+    return model._meta.get_field(to_field_name).attname
+
+
+class DunderModelChoiceIterator(ModelChoiceIterator):
+    """ModelChoiceIterator rendering the labels without instances.
+
+    Only the values and the columns shown by the str() of the model are
+    queried, using one values_list() query, and the labels are the same
+    as the str() of the instances the queryset would return.
+    Instances are used when the model does not use django-dunder, or the
+    field customises label_from_instance.  The choice values have no
+    instance.
+    """
+
+    def renders_rows(self):
+        field_class = self.field.__class__
+        return (
+            _function(field_class.label_from_instance) is
+            _label_from_instance and
+            renders_rows(self.queryset))
+
+    def __iter__(self):
+        if not self.renders_rows():
+            for choice in super(DunderModelChoiceIterator, self).__iter__():
+                yield choice
+            return
+
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+
+        column = value_column(self.queryset.model, self.field.to_field_name)
+        for value, label in render_choices(self.queryset, column):
+            if ModelChoiceIteratorValue is not None:
+                value = ModelChoiceIteratorValue(value, None)
+            yield (value, label)
+
+
+class DunderModelChoiceField(forms.ModelChoiceField):
+    """ModelChoiceField using DunderModelChoiceIterator."""
+
+    iterator = DunderModelChoiceIterator
+
+
+class DunderModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """ModelMultipleChoiceField using DunderModelChoiceIterator."""
+
+    iterator = DunderModelChoiceIterator
@@ -0,0 +1,55 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from django_dunder import app_settings
+from django_dunder._stats import read_stats, stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Show the rendering statistics recorded with DUNDER_STATS, which '
+        'the processes rendering write to DUNDER_STATS_DIR.  Without it, '
+        'only those of this process are shown, e.g. with call_command.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json', action='store_true',
+            help='Output the statistics as JSON.')
+        parser.add_argument(
+            '--reset', action='store_true',
+            help='Clear the statistics after showing them.')
+        parser.add_argument(
+            '--dir',
+            help='Read the statistics from this directory instead of '
+                 'DUNDER_STATS_DIR.')
+
+    def handle(self, *args, **options):
+        directory = options['dir'] or app_settings.STATS_DIR
+        if directory:
+            items = read_stats(directory, reset=options['reset'])
+        else:
+            items = stats(reset=options['reset'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(items, indent=2, sort_keys=True))
+            return
+
+        if not items:
+            self.stdout.write('No statistics recorded')
+            return
+
+        row = '{:<40} {:<4} {:>8} {:>10} {:>9} {:>9} {:>9} {:>9} {:>8} {:>8}'
+        self.stdout.write(row.format(
+            'model', 'mode', 'calls', 'total ms', 'mean us', 'p90 us',
+            'p99 us', 'max us', 'length', 'queries'))
+        for item in items:
+            self.stdout.write(row.format(
+                item['model'], item['mode'], item['calls'],
+                '{:.1f}'.format(item['time'] * 1e3),
+                '{:.1f}'.format(item['mean'] * 1e6),
+                '{:.1f}'.format(item['p90'] * 1e6),
+                '{:.1f}'.format(item['p99'] * 1e6),
+                '{:.1f}'.format(item['max'] * 1e6),
+                '{:.0f}'.format(item['mean_length']),
+                item['queries']))
@@ -1,11 +1,15 @@
 from django.db import models
 
-from .core import _model_repr, _model_str
+from .core import _get_mode, _model_repr, _model_str
+from ._plan import _uses_dunder, get_plan
 
 __all__ = [
     'DunderReprModel',
     'DunderStrModel',
     'DunderModel',
+    'DunderQuerySet',
+    'DunderManagerMixin',
+    'DunderManager',
 ]
 
 
@@ -26,3 +30,40 @@ class DunderStrModel(models.Model):
 class DunderModel(DunderReprModel, DunderStrModel):
     class Meta:
         abstract = True
+
+
+def for_display(queryset, mode='str'):
+    """Return queryset loading only what is shown by mode 'str' or 'repr'.
+
+    The queryset is returned unchanged if the model does not use
+    django-dunder for mode.
+    """
+    meta_field_name = _get_mode(mode)[0]
+    if not _uses_dunder(queryset.model, meta_field_name):
+        return queryset
+
+    plan = get_plan(queryset.model, meta_field_name)
+    if plan.select_related:
+        queryset = queryset.select_related(*plan.select_related)
+    if plan.prefetch_related:
+        queryset = queryset.prefetch_related(*plan.prefetch_related)
+    return queryset.only(*plan.only)
+
+
+class DunderQuerySet(models.QuerySet):
+
+    def for_display(self, mode='str'):
+        """Load only the fields and related objects shown by mode."""
+        return for_display(self, mode)
+
+
+class DunderManagerMixin(object):
+    """Adds for_display() to a manager of any QuerySet class."""
+
+    def for_display(self, mode='str'):
+        """Load only the fields and related objects shown by mode."""
+        return for_display(self.get_queryset(), mode)
+
+
+class DunderManager(models.Manager.from_queryset(DunderQuerySet)):
+    pass
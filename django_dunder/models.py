@@ -1,7 +1,8 @@
-from .app_settings import _ANY_REGISTER
+from .app_settings import _ANY_REGISTER, REGISTER_AT_READY
 
-# Start registration of models appearing after this app in INSTALLED_APPS
-if _ANY_REGISTER:
+# Start registration of models appearing after this app in INSTALLED_APPS,
+# unless all models are registered by DunderConfig.ready
+if _ANY_REGISTER and not REGISTER_AT_READY:
     from ._register import _register_models_receiver, _dunder_applied_counter
     _register_models_receiver()
 else:
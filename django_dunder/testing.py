@@ -0,0 +1,73 @@
+"""Helpers for tests that rendering model instances uses no queries.
+
+The pytest fixture can be enabled in a conftest.py with
+
+    pytest_plugins = ['django_dunder.testing']
+"""
+import contextlib
+
+from . import app_settings
+from ._guard import describe, loaded_fields, loaded_names, records
+from ._queries import call_recording_queries
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+__all__ = [
+    'assert_render_no_queries',
+    'query_guard',
+]
+
+_RENDER = {
+    'repr': repr,
+    'str': str,
+}
+
+
+@contextlib.contextmanager
+def query_guard(action='raise'):
+    """Enable DUNDER_QUERY_GUARD within the block.
+
+    The queries recorded with action 'record' are the items of the
+    returned list.
+    """
+    previous = app_settings.QUERY_GUARD
+    app_settings.QUERY_GUARD = action
+    saved = list(records)
+    records.clear()
+    found = []
+    try:
+        yield found
+    finally:
+        app_settings.QUERY_GUARD = previous
+        found.extend(records)
+        records.clear()
+        records.extend(saved)
+
+
+def assert_render_no_queries(obj, modes=('repr', 'str')):
+    """Fail if rendering obj issues any query."""
+    for mode in modes:
+        before = loaded_names(obj)
+        rv, queries = call_recording_queries(_RENDER[mode], obj)
+        if queries:
+            raise AssertionError(describe(
+                obj, mode, loaded_fields(obj, before), queries))
+
+
+def _dunder_query_guard():
+    """Fail the test if rendering any instance issued queries."""
+    with query_guard('record') as found:
+        yield found
+
+    if found:
+        pytest.fail('\n'.join(item['message'] for item in found))
+
+
+if pytest is not None:
+    dunder_query_guard = pytest.fixture(name='dunder_query_guard')(
+        _dunder_query_guard)
+
+    __all__.append('dunder_query_guard')
@@ -1,3 +1,7 @@
+import pytest
+
+from django.db import reset_queries
+
 from pytest_djangoapp import configure_djangoapp_plugin
 
 settings = {
@@ -5,4 +9,28 @@ settings = {
     'DUNDER_AUTO': False,
 }
 
-pytest_plugins = configure_djangoapp_plugin(settings)
+pytest_plugins = configure_djangoapp_plugin(settings, admin_contrib=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_queries():
+    # CaptureQueriesContext miscounts once the query log is full
+    reset_queries()
+
+
+@pytest.fixture
+def relation_tree(monkeypatch):
+    """Provide the reverse and many-to-many relations of the test models.
+
+    DunderConfig hides its models, so _meta would not find the relations.
+    """
+    from django.apps import apps
+
+    app_config = apps.get_app_config('dunder')
+    monkeypatch.setattr(
+        app_config, 'get_models',
+        lambda *args, **kwargs: list(app_config.models.values()))
+    apps.clear_cache()
+    yield
+    monkeypatch.undo()
+    apps.clear_cache()
@@ -0,0 +1,181 @@
+import json
+
+from django.contrib import admin
+from django.contrib.admin import helpers
+from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+from django.contrib.auth.models import User
+from django.db import connection, models
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import admin as dunder_admin
+from django_dunder.admin import DunderAdminMixin, DunderAutocompleteMixin
+from django_dunder.mixins import DunderModel
+from django_dunder._plan import get_plan
+
+from django_fake_model import models as f
+
+
+class AdminAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    bio = models.TextField(null=True, blank=True)
+
+
+class AdminBook(DunderModel, f.FakeModel):
+    title = models.TextField()
+    body = models.TextField(null=True, blank=True)
+    author = models.ForeignKey(AdminAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        str_fields = ('title', 'author')
+
+
+class AdminPerson(DunderModel, f.FakeModel):
+    first = models.TextField(unique=True)
+    last = models.TextField()
+    bio = models.TextField(null=True, blank=True)
+
+    def __str__(self):
+        return self.first + ' ' + self.last
+
+
+class AdminPersonAdmin(DunderAdminMixin, admin.ModelAdmin):
+    pass
+
+
+def read_bodies(model_admin, request, queryset):
+    model_admin.bodies = [item.body for item in queryset]
+
+
+class AdminBookAdmin(DunderAdminMixin, admin.ModelAdmin):
+    actions = [read_bodies]
+
+
+def test_plan_paths():
+    plan = get_plan(AdminBook, 'str_fields')
+
+    assert plan.select_related == ('author', )
+    assert plan.only == ('title', 'author', 'author__name')
+
+    plan = get_plan(AdminAuthor, 'str_fields')
+    assert plan.select_related == ()
+    assert plan.only == ('name', )
+
+
+def get_changelist(model_admin):
+    request = RequestFactory().get('/')
+    request.user = User(is_active=True, is_superuser=True)
+    return request, model_admin.get_changelist_instance(request)
+
+
+@AdminAuthor.fake_me
+@AdminBook.fake_me
+def test_admin_changelist():
+    for i in range(5):
+        author = AdminAuthor.objects.create(name='a{}'.format(i), bio='x')
+        AdminBook.objects.create(title='t{}'.format(i), body='y', author=author)
+
+    model_admin = AdminBookAdmin(AdminBook, admin.site)
+    model_admin.ordering = ('id', )
+    request, changelist = get_changelist(model_admin)
+
+    with CaptureQueriesContext(connection) as queries:
+        rendered = [str(item) for item in changelist.result_list]
+    assert len(queries) == 1
+    assert 'body' not in queries[0]['sql']
+    assert 'bio' not in queries[0]['sql']
+
+    assert rendered[0] == '<AdminBook: title=t0, author=<AdminAuthor: name=a0>>'
+
+    # Actions are given all the fields
+    request = RequestFactory().post('/', {
+        'action': 'read_bodies',
+        'index': 0,
+        helpers.ACTION_CHECKBOX_NAME: [
+            item.pk for item in changelist.result_list],
+    })
+    request.user = User(is_active=True, is_superuser=True)
+    with CaptureQueriesContext(connection) as queries:
+        model_admin.response_action(
+            request, queryset=changelist.get_queryset(request))
+    assert len(queries) == 1
+    assert model_admin.bodies == ['y'] * 5
+
+    model_admin.list_display = ('__str__', 'body')
+    request, changelist = get_changelist(model_admin)
+
+    with CaptureQueriesContext(connection) as queries:
+        items = list(changelist.result_list)
+        assert [item.body for item in items] == ['y'] * 5
+    assert len(queries) == 1
+    assert 'bio' in queries[0]['sql']
+
+
+@AdminPerson.fake_me
+def test_admin_changelist_own_str():
+    for i in range(5):
+        AdminPerson.objects.create(first='f{}'.format(i), last='l', bio='x')
+
+    model_admin = AdminPersonAdmin(AdminPerson, admin.site)
+    model_admin.ordering = ('id', )
+    request, changelist = get_changelist(model_admin)
+
+    with CaptureQueriesContext(connection) as queries:
+        rendered = [str(item) for item in changelist.result_list]
+    assert len(queries) == 1
+    assert rendered == ['f{} l'.format(i) for i in range(5)]
+
+
+class AutocompleteView(DunderAutocompleteMixin, AutocompleteJsonView):
+    pass
+
+
+class AdminAuthorAdmin(admin.ModelAdmin):
+    ordering = ('name', )
+    search_fields = ('name', )
+
+
+def autocomplete(view_class, term=''):
+    site = admin.AdminSite(name='autocomplete')
+    site.register(AdminAuthor, AdminAuthorAdmin)
+    site.register(AdminBook, AdminBookAdmin)
+
+    request = RequestFactory().get('/', {
+        'term': term,
+        'app_label': AdminBook._meta.app_label,
+        'model_name': 'adminbook',
+        'field_name': 'author',
+    })
+    request.user = User(is_active=True, is_superuser=True)
+    response = view_class.as_view(admin_site=site)(request)
+    return json.loads(response.content.decode())
+
+
+@AdminAuthor.fake_me
+@AdminBook.fake_me
+def test_admin_autocomplete():
+    for i in range(3):
+        AdminAuthor.objects.create(name='a{}'.format(i), bio='x')
+
+    with CaptureQueriesContext(connection) as queries:
+        data = autocomplete(AutocompleteView, 'a')
+    assert 'bio' not in queries[-1]['sql']
+
+    assert data['results'] == [
+        {'id': str(item.pk), 'text': str(item)}
+        for item in AdminAuthor.objects.order_by('name')
+    ]
+    assert data == autocomplete(AutocompleteJsonView, 'a')
+
+
+@AdminAuthor.fake_me
+@AdminBook.fake_me
+def test_admin_autocomplete_instances(monkeypatch):
+    # Before Django 4.0, the results are serialised from object_list
+    monkeypatch.setattr(dunder_admin, '_SERIALIZE_RESULT', False)
+    AdminAuthor.objects.create(name='a0', bio='x')
+
+    with CaptureQueriesContext(connection) as queries:
+        data = autocomplete(AutocompleteView, 'a')
+    assert 'bio' in queries[-1]['sql']
+    assert data == autocomplete(AutocompleteJsonView, 'a')
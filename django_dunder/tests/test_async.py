@@ -0,0 +1,125 @@
+from asgiref.sync import async_to_sync
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import (
+    app_settings,
+    arender_queryset,
+    arepr,
+    astr,
+)
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+
+class AsyncAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    bio = models.TextField(null=True, blank=True)
+
+
+class AsyncBook(DunderModel, f.FakeModel):
+    title = models.TextField()
+    author = models.ForeignKey(AsyncAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        str_fields = ('title', 'author')
+        repr_fields = ('title', 'author__name')
+
+
+class AsyncTag(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class AsyncTagged(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    note = models.TextField(null=True, blank=True)
+    tags = models.ManyToManyField(AsyncTag)
+
+    class Meta:
+        str_fields = ('name', 'tags__name')
+
+
+class AsyncPlain(f.FakeModel):
+    name = models.TextField()
+
+    def __str__(self):
+        return self.name
+
+
+def render(func, *args):
+    # Queries issued without the async ORM raise SynchronousOnlyOperation
+    async def run():
+        return await func(*args)
+
+    return async_to_sync(run)()
+
+
+@AsyncAuthor.fake_me
+def test_async_deferred():
+    AsyncAuthor.objects.create(name='a', bio='x')
+
+    item = AsyncAuthor.objects.only('id').get()
+    with CaptureQueriesContext(connection) as queries:
+        assert render(astr, item) == '<AsyncAuthor: name=a>'
+    assert len(queries) == 1
+    assert 'bio' not in queries[0]['sql']
+
+    with CaptureQueriesContext(connection) as queries:
+        assert render(arepr, item) == "AsyncAuthor(name='a')"
+    assert len(queries) == 0
+
+
+@AsyncAuthor.fake_me
+@AsyncBook.fake_me
+def test_async_related():
+    author = AsyncAuthor.objects.create(name='a')
+    AsyncBook.objects.create(title='t', author=author)
+
+    item = AsyncBook.objects.get()
+    assert render(astr, item) == '<AsyncBook: title=t, author_id=1>'
+
+    app_settings.FETCH_RELATED = True
+    try:
+        item = AsyncBook.objects.only('title').get()
+        with CaptureQueriesContext(connection) as queries:
+            assert render(astr, item) == (
+                '<AsyncBook: title=t, author=<AsyncAuthor: name=a>>')
+            assert render(arepr, item) == (
+                "AsyncBook(title='t', author__name='a')")
+        assert len(queries) == 2
+    finally:
+        app_settings.FETCH_RELATED = False
+
+
+@AsyncAuthor.fake_me
+@AsyncPlain.fake_me
+def test_async_queryset():
+    AsyncAuthor.objects.create(name='a')
+    AsyncAuthor.objects.create(name='b')
+
+    async def collect(queryset, mode):
+        return [line async for line in arender_queryset(queryset, mode)]
+
+    assert render(collect, AsyncAuthor.objects.order_by('name'), 'str') == [
+        '<AsyncAuthor: name=a>', '<AsyncAuthor: name=b>']
+
+    item = AsyncPlain.objects.create(name='p')
+    assert render(astr, item) == 'p'
+
+
+@AsyncTag.fake_me
+@AsyncTagged.fake_me
+def test_async_many(relation_tree):
+    item = AsyncTagged.objects.create(name='a')
+    item.tags.add(
+        AsyncTag.objects.create(name='x'), AsyncTag.objects.create(name='y'))
+
+    app_settings.FETCH_RELATED = True
+    try:
+        item = AsyncTagged.objects.get()
+        assert render(astr, item) == (
+            "<AsyncTagged: name=a, tags__name=['x', 'y']>")
+    finally:
+        app_settings.FETCH_RELATED = False
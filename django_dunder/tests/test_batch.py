@@ -0,0 +1,93 @@
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import render_instances
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+
+class BatchUser(DunderModel, f.FakeModel):
+    username = models.TextField(unique=True)
+    bio = models.TextField(null=True, blank=True)
+
+
+class BatchTeam(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    lead = models.ForeignKey(BatchUser, on_delete=models.CASCADE)
+
+
+class BatchEntry(DunderModel, f.FakeModel):
+    action = models.TextField()
+    user = models.ForeignKey(
+        BatchUser, related_name='+', on_delete=models.CASCADE)
+    reviewer = models.ForeignKey(
+        BatchUser, null=True, related_name='+', on_delete=models.CASCADE)
+    team = models.ForeignKey(BatchTeam, on_delete=models.CASCADE)
+
+    class Meta:
+        str_fields = ('action', 'user', 'reviewer', 'team__lead__username')
+
+
+class BatchPlain(f.FakeModel):
+    name = models.TextField()
+
+    def __str__(self):
+        return self.name
+
+
+def create_entries(count):
+    users = [
+        BatchUser.objects.create(username='u{}'.format(i)) for i in range(3)]
+    team = BatchTeam.objects.create(name='t', lead=users[2])
+    for i in range(count):
+        BatchEntry.objects.create(
+            action='a{}'.format(i), user=users[i % 2],
+            reviewer=users[1] if i % 2 else None, team=team)
+
+
+@BatchUser.fake_me
+@BatchTeam.fake_me
+@BatchEntry.fake_me
+def test_render_instances():
+    create_entries(4)
+
+    entries = list(BatchEntry.objects.order_by('id'))
+    with CaptureQueriesContext(connection) as queries:
+        rendered = render_instances(entries)
+    # The users of both relations, the teams and the team leads
+    assert len(queries) == 3
+
+    assert rendered[:2] == [
+        '<BatchEntry: action=a0, user=<BatchUser: username=u0>, '
+        'team__lead__username=u2>',
+        '<BatchEntry: action=a1, user=<BatchUser: username=u1>, '
+        'reviewer=<BatchUser: username=u1>, team__lead__username=u2>',
+    ]
+    with CaptureQueriesContext(connection) as queries:
+        assert rendered == [str(entry) for entry in entries]
+    assert len(queries) == 0
+
+    assert render_instances(
+        BatchEntry.objects.order_by('id')[:1], fetch_related=None) == [
+        '<BatchEntry: action=a0, user_id=1>']
+
+
+@BatchUser.fake_me
+@BatchTeam.fake_me
+@BatchEntry.fake_me
+def test_render_instances_fixed_queries():
+    create_entries(50)
+
+    entries = list(BatchEntry.objects.only('action', 'user'))
+    with CaptureQueriesContext(connection) as queries:
+        render_instances(entries)
+    # The deferred fields, the users of both relations, the teams and
+    # the team leads
+    assert len(queries) == 4
+
+
+@BatchPlain.fake_me
+def test_render_instances_other():
+    item = BatchPlain.objects.create(name='p')
+    assert render_instances([item, 1]) == ['p', '1']
@@ -0,0 +1,106 @@
+import pytest
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import render_queryset
+from django_dunder.bulk import renders_rows
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+
+class BulkAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    bio = models.TextField(null=True, blank=True)
+
+
+class BulkBook(DunderModel, f.FakeModel):
+    author = models.ForeignKey(BulkAuthor, on_delete=models.CASCADE)
+
+
+class BulkDefault(DunderModel, f.FakeModel):
+    name1 = models.TextField(null=True, blank=True)
+    name2 = models.CharField(max_length=10, blank=True)
+    number = models.IntegerField(default=3)
+
+
+@BulkAuthor.fake_me
+def test_render_queryset_unique():
+    BulkAuthor.objects.create(name='a', bio='x' * 100)
+    BulkAuthor.objects.create(name='b')
+
+    with CaptureQueriesContext(connection) as queries:
+        rendered = list(render_queryset(BulkAuthor.objects.order_by('name')))
+    assert rendered == ['<BulkAuthor: name=a>', '<BulkAuthor: name=b>']
+    assert len(queries) == 1
+    assert 'bio' not in queries[0]['sql']
+
+    rendered = list(render_queryset(BulkAuthor.objects.all(), 'repr'))
+    assert rendered == [repr(item) for item in BulkAuthor.objects.all()]
+
+
+@BulkAuthor.fake_me
+@BulkBook.fake_me
+def test_render_queryset_related():
+    author = BulkAuthor.objects.create(name='a')
+    BulkBook.objects.create(author=author)
+
+    with CaptureQueriesContext(connection) as queries:
+        rendered = list(render_queryset(BulkBook.objects.all()))
+    assert rendered == ['<BulkBook: author_id=1>']
+    assert len(queries) == 1
+
+
+@BulkDefault.fake_me
+def test_render_queryset_defaults():
+    BulkDefault.objects.create(name1='a')
+    BulkDefault.objects.create(name2='b', number=4)
+
+    expected = [str(item) for item in BulkDefault.objects.all()]
+    assert expected == [
+        '<BulkDefault: id=1, name1=a>',
+        '<BulkDefault: id=2, name2=b, number=4>',
+    ]
+    assert list(render_queryset(BulkDefault.objects.all())) == expected
+
+
+class BulkPlain(f.FakeModel):
+    name = models.TextField()
+
+    def __str__(self):
+        return self.name
+
+
+def test_render_queryset_other():
+    # The own __str__ of the model could show anything
+    with pytest.raises(ValueError):
+        list(render_queryset(BulkPlain.objects.all()))
+
+
+class BulkFile(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    upload = models.FileField(null=True, blank=True)
+
+    class Meta:
+        repr_fields = ('name', 'upload')
+
+
+@BulkFile.fake_me
+def test_render_queryset_file():
+    BulkFile.objects.create(name='a', upload='x.txt')
+
+    # The FieldFile is only shown by instances
+    assert [repr(item) for item in BulkFile.objects.all()] == [
+        "BulkFile(name='a', upload=<FieldFile: x.txt>)"]
+    with pytest.raises(ValueError):
+        list(render_queryset(BulkFile.objects.all(), 'repr'))
+    assert not renders_rows(BulkFile.objects.all(), 'repr')
+
+    assert list(render_queryset(BulkFile.objects.all())) == [
+        '<BulkFile: name=a>']
+
+
+def test_render_queryset_mode():
+    with pytest.raises(ValueError):
+        list(render_queryset(BulkDefault.objects.all(), 'unicode'))
@@ -0,0 +1,99 @@
+from django.db import models
+
+from django_dunder import app_settings
+from django_dunder.mixins import DunderModel
+from django_dunder._codegen import _parse_attr_fmt, _parse_instance_fmt
+
+from django_fake_model import models as f
+
+
+def test_parse_attr_fmt():
+    assert _parse_attr_fmt('{name}={value!r}')[1:] == ('r', [])
+    assert _parse_attr_fmt('{name}: {value}.')[1:] == (None, ['.'])
+    assert _parse_attr_fmt('{value!s}')[1:] == ('s', [])
+
+    assert _parse_attr_fmt('{name}') is None
+    assert _parse_attr_fmt('{name}={value.title}') is None
+    assert _parse_attr_fmt('{name}={value[0]}') is None
+    assert _parse_attr_fmt('{name}={value:>10}') is None
+    assert _parse_attr_fmt('{name!r}={value}') is None
+
+
+def test_parse_instance_fmt():
+    assert _parse_instance_fmt('{}({})') == ['', '(', ')']
+    assert _parse_instance_fmt('<{0}: {1}>') == ['<', ': ', '>']
+
+    assert _parse_instance_fmt('{1}({0})') is None
+    assert _parse_instance_fmt('{!r}({})') is None
+    assert _parse_instance_fmt('{}') is None
+
+
+class CodegenDefault(DunderModel, f.FakeModel):
+    name1 = models.TextField(null=True, blank=True)
+    name2 = models.TextField(null=True, blank=True)
+    number = models.IntegerField(null=True, blank=True)
+
+
+class CodegenTwoFields(DunderModel, f.FakeModel):
+    name = models.TextField(null=True, blank=True)
+
+
+@CodegenDefault.fake_me
+@CodegenTwoFields.fake_me
+def test_codegen_formats():
+    items = [
+        CodegenDefault.objects.create(name1='a', name2="b'", number=0),
+        CodegenDefault.objects.create(number=5),
+        CodegenTwoFields.objects.create(),
+        CodegenTwoFields.objects.create(name='x'),
+    ]
+
+    formats = [
+        ('{name}={value}', '<{}: {}>', [
+            "<CodegenDefault: id=1, name1=a, name2=b'>",
+            '<CodegenDefault: id=2, number=5>',
+            '<CodegenTwoFields: id=1>',
+            '<CodegenTwoFields: name=x>',
+        ]),
+        ('{name}={value!r}', '{}({})', [
+            'CodegenDefault(id=1, name1=\'a\', name2="b\'")',
+            'CodegenDefault(id=2, number=5)',
+            'CodegenTwoFields(id=1)',
+            "CodegenTwoFields(name='x')",
+        ]),
+        ('{value}', '{}', [
+            'CodegenDefault',
+            'CodegenDefault',
+            'CodegenTwoFields',
+            'CodegenTwoFields',
+        ]),
+        ('[{name}] {value}', '{1} for {0}', [
+            "[id] 1, [name1] a, [name2] b' for CodegenDefault",
+            '[id] 2, [number] 5 for CodegenDefault',
+            '[id] 1 for CodegenTwoFields',
+            '[name] x for CodegenTwoFields',
+        ]),
+        # Not compiled
+        ('{name}={value.title}', '<{0}: {1}>', [
+            "<CodegenDefault: id=1, name1=A, name2=B'>",
+            '<CodegenDefault: id=2, number=5>',
+            '<CodegenTwoFields: id=1>',
+            '<CodegenTwoFields: name=X>',
+        ]),
+    ]
+
+    try:
+        for attr_fmt, instance_fmt, expected in formats:
+            app_settings.STR_ATTR_FMT = attr_fmt
+            app_settings.STR_FMT = instance_fmt
+            assert [str(item) for item in items] == expected
+    finally:
+        app_settings.STR_ATTR_FMT = '{name}={value}'
+        app_settings.STR_FMT = '<{}: {}>'
+
+    assert [repr(item) for item in items] == [
+        'CodegenDefault(id=1, name1=\'a\', name2="b\'")',
+        'CodegenDefault(id=2, number=5)',
+        'CodegenTwoFields(id=1)',
+        "CodegenTwoFields(name='x')",
+    ]
@@ -0,0 +1,91 @@
+import pytest
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder.mixins import DunderManager, DunderManagerMixin, DunderModel
+
+from django_fake_model import models as f
+
+
+class DisplayAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    bio = models.TextField(null=True, blank=True)
+
+    objects = DunderManager()
+
+
+class CustomManager(DunderManagerMixin, models.Manager):
+    pass
+
+
+class DisplayBook(DunderModel, f.FakeModel):
+    title = models.TextField()
+    body = models.TextField(null=True, blank=True)
+    author = models.ForeignKey(DisplayAuthor, on_delete=models.CASCADE)
+
+    objects = CustomManager()
+
+    class Meta:
+        unique_together = [('title', 'author')]
+        repr_fields = ('title', 'body')
+
+
+class DisplayPerson(DunderModel, f.FakeModel):
+    first = models.TextField(unique=True)
+    last = models.TextField()
+
+    objects = DunderManager()
+
+    def __str__(self):
+        return self.first + ' ' + self.last
+
+
+@DisplayAuthor.fake_me
+@DisplayBook.fake_me
+def test_for_display():
+    author = DisplayAuthor.objects.create(name='a', bio='x')
+    DisplayBook.objects.create(title='t', body='y', author=author)
+
+    with CaptureQueriesContext(connection) as queries:
+        item = DisplayAuthor.objects.filter(name='a').for_display().get()
+        assert str(item) == '<DisplayAuthor: name=a>'
+    assert len(queries) == 1
+    assert 'bio' not in queries[0]['sql']
+
+    with CaptureQueriesContext(connection) as queries:
+        item = DisplayBook.objects.for_display().get()
+        assert str(item) == (
+            '<DisplayBook: title=t, author=<DisplayAuthor: name=a>>')
+    assert len(queries) == 1
+    assert 'body' not in queries[0]['sql']
+    assert 'bio' not in queries[0]['sql']
+
+    with CaptureQueriesContext(connection) as queries:
+        item = DisplayBook.objects.for_display('repr').get()
+        assert repr(item) == "DisplayBook(title='t', body='y')"
+    assert len(queries) == 1
+    assert 'author' not in queries[0]['sql']
+
+    with pytest.raises(ValueError):
+        DisplayBook.objects.for_display('unicode')
+
+
+@DisplayPerson.fake_me
+def test_for_display_own_str():
+    for i in range(5):
+        DisplayPerson.objects.create(first='f{}'.format(i), last='l')
+
+    with CaptureQueriesContext(connection) as queries:
+        rendered = [
+            str(item)
+            for item in DisplayPerson.objects.order_by('id').for_display()]
+    assert len(queries) == 1
+    assert rendered == ['f{} l'.format(i) for i in range(5)]
+
+    # repr still uses django-dunder
+    with CaptureQueriesContext(connection) as queries:
+        item = DisplayPerson.objects.for_display('repr').first()
+        assert repr(item) == "DisplayPerson(first='f0')"
+    assert len(queries) == 1
+    assert 'last' not in queries[0]['sql']
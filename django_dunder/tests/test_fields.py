@@ -0,0 +1,117 @@
+import datetime
+import decimal
+import uuid
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import render_queryset
+from django_dunder.core import field_value
+from django_dunder.mixins import DunderModel
+from django_dunder._fields import default_predicate, stores_value
+
+from django_fake_model import models as f
+
+
+class TypedOwner(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class Typed(DunderModel, f.FakeModel):
+    status = models.CharField(
+        max_length=1, choices=[('a', 'Active'), ('i', 'Inactive')])
+    amount = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True)
+    day = models.DateField(null=True, blank=True)
+    owner = models.ForeignKey(
+        TypedOwner, null=True, blank=True, on_delete=models.CASCADE)
+
+
+@TypedOwner.fake_me
+@Typed.fake_me
+def test_typed_str():
+    owner = TypedOwner.objects.create(name='a')
+    Typed.objects.create(
+        status='a', amount=decimal.Decimal('5.1'),
+        day=datetime.date(2020, 1, 2), owner=owner)
+
+    item = Typed.objects.get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == (
+            '<Typed: id=1, status=Active, amount=5.10, day=2020-01-02, '
+            'owner_id=1>')
+        assert repr(item) == (
+            "Typed(id=1, status='a', amount=Decimal('5.10'), "
+            "day=datetime.date(2020, 1, 2), owner_id=1)")
+    assert len(queries) == 0
+
+    assert list(render_queryset(Typed.objects.all())) == [str(item)]
+
+
+@Typed.fake_me
+def test_typed_unexpected_values():
+    item = Typed(id=1, status='x', amount='abc', day='today')
+
+    assert str(item) == '<Typed: id=1, status=x, amount=abc, day=today>'
+
+
+def test_default_predicate():
+    assert default_predicate(models.TextField()) is None
+    assert default_predicate(models.TextField(default='')) is None
+    assert default_predicate(models.IntegerField(default=0)) is None
+    assert default_predicate(models.TextField(default=dict)) is None
+    assert default_predicate(models.UUIDField(default=uuid.uuid4)) is None
+
+    is_default = default_predicate(models.IntegerField(default=3))
+    assert is_default(3)
+    assert not is_default(4)
+
+    is_default = default_predicate(models.TextField(default=lambda: 'a'))
+    assert is_default is None
+
+    is_default = default_predicate(models.TextField(default=[1, 2]))
+    assert is_default([1, 2])
+    assert not is_default((1, 2))
+    assert not is_default(list(range(10000)))
+
+
+class TypedDefaults(DunderModel, f.FakeModel):
+    name = models.TextField(null=True, blank=True)
+    number = models.IntegerField(default=3)
+    code = models.UUIDField(default=uuid.uuid4)
+
+
+@TypedDefaults.fake_me
+def test_typed_defaults():
+    item = TypedDefaults.objects.create(
+        name='a', code=uuid.UUID(int=1))
+
+    assert str(item) == (
+        '<TypedDefaults: id=1, name=a, '
+        'code=00000000-0000-0000-0000-000000000001>')
+
+    item.number = 4
+    assert str(item) == (
+        '<TypedDefaults: id=1, name=a, number=4, '
+        'code=00000000-0000-0000-0000-000000000001>')
+
+
+def test_field_value():
+    item = TypedDefaults(name='', number=3)
+    meta = TypedDefaults._meta
+    assert field_value(item, meta.get_field('name')) is None
+    assert field_value(item, meta.get_field('number')) is None
+
+    item = TypedDefaults(name='a', number=4)
+    assert field_value(item, meta.get_field('name')) == 'a'
+    assert field_value(item, meta.get_field('number')) == 4
+
+
+class TypedFile(DunderModel, f.FakeModel):
+    upload = models.FileField(null=True, blank=True)
+
+
+def test_stores_value():
+    assert stores_value(TypedDefaults, TypedDefaults._meta.get_field('name'))
+    assert stores_value(Typed, Typed._meta.get_field('owner'))
+    assert not stores_value(TypedFile, TypedFile._meta.get_field('upload'))
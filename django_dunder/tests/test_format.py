@@ -10,7 +10,11 @@ except ImportError as e:
 
 from django_dunder import app_settings
 from django_dunder.mixins import DunderModel
-from django_dunder._formatter import _get_one_invoke
+from django_dunder._formatter import (
+    FormattableObjectWrapper,
+    _get_one_invoke,
+    compile_attr_fmt,
+)
 from django_dunder._register import PY3
 
 from django_fake_model import models as f
@@ -274,3 +278,41 @@ if datatype_tools:
                     day=item.date1.day, month=item.date1.month, year=item.date1.year))
         finally:
             app_settings.STR_ATTR_FMT = '{name}={value}'
+
+
+def test_compile_attr_fmt():
+    formats = [
+        '{name}={value}',
+        '{name}={value!r}',
+        '{name}={value.title}',
+        '{name}={value.title()}',
+        '{name}={value.round}',
+        '{name}={value.round(1)}',
+        '{name}={value.title__round}',
+        '{name}={value.round__title}',
+        '{name}={value.round()__title()}',
+        '{name}={value.round(), title()}',
+        '{name}={value.round().title()}',
+        '{name}={value.title__round__replace_a_f}',
+        '{name}={value.replace_a_f__round__title}',
+        '{name}={value.ellipsis_10__round}',
+        '{name}={value.round__ellipsis_10!r}',
+        '{name}={value.missing}',
+        '{name}={value[4]}',
+        '{name[0]}={value[0:5]!r}',
+    ]
+    values = ['abc', 'abcdefghijklmnop', 5.129, 1, datetime.date.today()]
+
+    for fmt in formats:
+        compiled = compile_attr_fmt(fmt)
+        assert compiled is not None, fmt
+        assert compile_attr_fmt(fmt) is compiled
+        for value in values:
+            expected = fmt.format(
+                name='name', value=FormattableObjectWrapper(value))
+            assert compiled.format(name='name', value=value) == expected
+
+
+def test_compile_attr_fmt_unsupported():
+    assert compile_attr_fmt('{name}={0}') is None
+    assert compile_attr_fmt('{name}={value:{width}}') is None
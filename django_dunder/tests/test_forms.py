@@ -0,0 +1,90 @@
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import app_settings
+from django_dunder.forms import (
+    DunderModelChoiceField,
+    DunderModelMultipleChoiceField,
+)
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+
+class ChoiceAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    bio = models.TextField(null=True, blank=True)
+
+
+class ChoiceBook(DunderModel, f.FakeModel):
+    title = models.TextField()
+    author = models.ForeignKey(ChoiceAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        str_fields = ('title', 'author')
+
+
+class LabelField(DunderModelChoiceField):
+
+    def label_from_instance(self, obj):
+        return obj.name.upper()
+
+
+@ChoiceAuthor.fake_me
+@ChoiceBook.fake_me
+def test_choice_field():
+    for name in ('a', 'b'):
+        author = ChoiceAuthor.objects.create(name=name, bio='x' * 100)
+        ChoiceBook.objects.create(title='t' + name, author=author)
+
+    queryset = ChoiceAuthor.objects.order_by('name')
+    field = DunderModelChoiceField(queryset)
+    with CaptureQueriesContext(connection) as queries:
+        # list() would also count the choices
+        choices = [choice for choice in field.choices]
+    assert len(queries) == 1
+    assert 'bio' not in queries[0]['sql']
+
+    assert [(str(value), label) for value, label in choices] == [
+        ('', field.empty_label),
+        ('1', '<ChoiceAuthor: name=a>'),
+        ('2', '<ChoiceAuthor: name=b>'),
+    ]
+    assert [label for value, label in choices[1:]] == [
+        str(item) for item in queryset]
+    assert field.clean('2') == ChoiceAuthor.objects.get(name='b')
+
+    field = DunderModelMultipleChoiceField(queryset, to_field_name='name')
+    assert [(str(value), label) for value, label in field.choices] == [
+        ('a', '<ChoiceAuthor: name=a>'),
+        ('b', '<ChoiceAuthor: name=b>'),
+    ]
+
+    field = DunderModelChoiceField(
+        ChoiceBook.objects.order_by('id'), empty_label=None)
+    assert [label for value, label in field.choices] == [
+        str(item) for item in ChoiceBook.objects.order_by('id')]
+
+    field = LabelField(queryset)
+    assert [label for value, label in field.choices] == ['---------', 'A', 'B']
+
+
+@ChoiceAuthor.fake_me
+@ChoiceBook.fake_me
+def test_choice_field_fetch_related():
+    author = ChoiceAuthor.objects.create(name='a')
+    ChoiceBook.objects.create(title='t', author=author)
+
+    queryset = ChoiceBook.objects.all()
+    field = DunderModelChoiceField(queryset, empty_label=None)
+    assert [label for value, label in field.choices] == [
+        '<ChoiceBook: title=t, author_id=1>']
+
+    app_settings.FETCH_RELATED = True
+    try:
+        labels = [label for value, label in field.choices]
+        assert labels == [
+            '<ChoiceBook: title=t, author=<ChoiceAuthor: name=a>>']
+        assert labels == [str(item) for item in queryset]
+    finally:
+        app_settings.FETCH_RELATED = False
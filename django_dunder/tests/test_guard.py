@@ -0,0 +1,125 @@
+import warnings
+
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+from django_dunder import app_settings
+from django_dunder.mixins import DunderModel
+from django_dunder.testing import (
+    assert_render_no_queries,
+    dunder_query_guard,  # noqa: F401
+    query_guard,
+    _dunder_query_guard,
+)
+from django_dunder._guard import RenderQueryError, RenderQueryWarning
+
+from django_fake_model import models as f
+
+
+class GuardAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class GuardBook(DunderModel, f.FakeModel):
+    author = models.ForeignKey(GuardAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        dunder_fetch_related = True
+
+
+@GuardAuthor.fake_me
+@GuardBook.fake_me
+def test_guard_raise():
+    author = GuardAuthor.objects.create(name='a')
+    GuardBook.objects.create(author=author)
+
+    with query_guard('raise'):
+        item = GuardBook.objects.get()
+        with pytest.raises(RenderQueryError) as excinfo:
+            str(item)
+
+    message = str(excinfo.value)
+    assert message.startswith(
+        'str of dunder.GuardBook issued 1 queries, loading author: SELECT')
+
+    item = GuardBook.objects.select_related('author').get()
+    with query_guard('raise'):
+        assert str(item) == '<GuardBook: author=<GuardAuthor: name=a>>'
+
+
+@GuardAuthor.fake_me
+@GuardBook.fake_me
+def test_guard_warn_and_record():
+    author = GuardAuthor.objects.create(name='a')
+    GuardBook.objects.create(author=author)
+
+    with query_guard('warn'):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            assert repr(GuardBook.objects.get()) == (
+                "GuardBook(author=GuardAuthor(name='a'))")
+    assert len(caught) == 1
+    assert caught[0].category is RenderQueryWarning
+
+    with query_guard('record') as found:
+        repr(GuardBook.objects.get())
+    assert len(found) == 1
+    assert found[0]['model'] == 'dunder.GuardBook'
+    assert found[0]['mode'] == 'repr'
+    assert found[0]['fields'] == ['author']
+
+
+@GuardAuthor.fake_me
+def test_guard_deferred():
+    GuardAuthor.objects.create(name='a')
+
+    old_skip_deferred = app_settings.SKIP_DEFERRED
+    app_settings.SKIP_DEFERRED = False
+    try:
+        item = GuardAuthor.objects.only('id').get()
+        with pytest.raises(AssertionError) as excinfo:
+            assert_render_no_queries(item)
+
+        assert 'repr of dunder.GuardAuthor issued 1 queries, loading name' in (
+            str(excinfo.value))
+
+        app_settings.SKIP_DEFERRED = True
+        assert_render_no_queries(GuardAuthor.objects.only('id').get())
+    finally:
+        app_settings.SKIP_DEFERRED = old_skip_deferred
+
+
+@GuardAuthor.fake_me
+def test_guard_fixture(dunder_query_guard):
+    GuardAuthor.objects.create(name='a')
+
+    assert str(GuardAuthor.objects.get()) == '<GuardAuthor: name=a>'
+
+
+@GuardAuthor.fake_me
+@GuardBook.fake_me
+def test_guard_fixture_fails():
+    author = GuardAuthor.objects.create(name='a')
+    GuardBook.objects.create(author=author)
+
+    fixture = _dunder_query_guard()
+    found = next(fixture)
+    str(GuardBook.objects.get())
+
+    with pytest.raises(pytest.fail.Exception) as excinfo:
+        next(fixture)
+    assert str(excinfo.value).startswith(
+        'str of dunder.GuardBook issued 1 queries, loading author: SELECT')
+    assert [item['model'] for item in found] == ['dunder.GuardBook']
+
+
+def test_guard_setting():
+    app_settings.QUERY_GUARD = 'warning'
+    try:
+        with pytest.raises(ImproperlyConfigured):
+            app_settings._post_process()
+    finally:
+        app_settings.QUERY_GUARD = False
+        app_settings._post_process()
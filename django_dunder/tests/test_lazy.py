@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import lazy
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+
+class LazyItem(DunderModel, f.FakeModel):
+    name = models.TextField(null=True, blank=True)
+
+
+class LazyAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class LazyBook(DunderModel, f.FakeModel):
+    title = models.TextField()
+    author = models.ForeignKey(LazyAuthor, on_delete=models.CASCADE)
+    data = models.JSONField(null=True, blank=True)
+
+    class Meta:
+        str_fields = ('title', 'author', 'data')
+        repr_fields = ('title', 'author', 'data')
+
+
+class LazyCustom(f.FakeModel):
+    name = models.TextField(null=True, blank=True)
+
+    def __str__(self):
+        return 'custom ' + self.name
+
+
+def test_lazy_captures_values():
+    item = LazyItem(name='a')
+
+    rendered = lazy(item)
+    rendered_str = lazy(item, 'str')
+    item.name = 'b'
+
+    assert str(rendered) == "LazyItem(name='a')"
+    assert repr(rendered) == "LazyItem(name='a')"
+    assert str(rendered_str) == '<LazyItem: name=a>'
+    assert '{}'.format(lazy(item)) == "LazyItem(name='b')"
+
+
+@LazyAuthor.fake_me
+@LazyBook.fake_me
+def test_lazy_captures_related():
+    author = LazyAuthor.objects.create(name='a')
+    LazyBook.objects.create(title='t', author=author, data={'k': [1]})
+
+    item = LazyBook.objects.select_related('author').get()
+    rendered = lazy(item)
+    rendered_str = lazy(item, 'str')
+    item.author.name = 'b'
+    item.data['k'].append(2)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert str(rendered) == (
+            "LazyBook(title='t', author=LazyAuthor(name='a'), "
+            "data={'k': [1]})")
+        assert str(rendered_str) == (
+            "<LazyBook: title=t, author=<LazyAuthor: name=a>, "
+            "data={'k': [1]}>")
+    assert len(queries) == 0
+
+
+def test_lazy_renders_once():
+    rendered = lazy(LazyItem(name='a'))
+
+    text = str(rendered)
+    assert str(rendered) is text
+
+
+def test_lazy_other_objects():
+    item = LazyCustom(id=1, name='a')
+
+    rendered = lazy(item, 'str')
+    item.name = 'b'
+    assert str(rendered) == 'custom b'
+
+    assert str(lazy([1, 2])) == '[1, 2]'
+
+    with pytest.raises(ValueError):
+        lazy(item, 'unicode')
+
+
+@LazyItem.fake_me
+def test_lazy_logging(caplog):
+    item = LazyItem.objects.create(name='a')
+    logger = logging.getLogger('django_dunder.tests.lazy')
+
+    rendered = lazy(item)
+    with CaptureQueriesContext(connection) as queries:
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            logger.debug('saved %s', rendered)
+            logger.info('saved %s', rendered)
+    assert len(queries) == 0
+
+    assert caplog.messages == ["saved LazyItem(name='a')"]
@@ -0,0 +1,124 @@
+from django.db import models
+
+from django_dunder import app_settings
+from django_dunder.mixins import DunderModel
+from django_dunder._formatter import (
+    ContainerRepr,
+    limit_container,
+    limit_value,
+    shorten,
+)
+
+from django_fake_model import models as f
+
+
+def test_shorten():
+    assert shorten('abc', 3) == 'abc'
+    assert shorten('abcd', 3) == '...'
+    assert shorten('abcdefghij', 6) == 'abc...'
+
+
+def test_limit_value():
+    assert limit_value('a' * 20) == 'a' * 20
+    assert limit_value('a' * 20, 10) == 'a' * 7 + '...'
+    assert limit_value(5, 1) == 5
+    assert str(limit_value(b'abc')) == '<3 bytes>'
+    assert repr(limit_value(memoryview(b'abcd'))) == '<4 bytes>'
+
+
+class LimitDefault(DunderModel, f.FakeModel):
+    name1 = models.TextField(null=True, blank=True)
+    name2 = models.TextField(null=True, blank=True)
+    data = models.BinaryField(null=True, blank=True)
+
+
+class LimitMeta(DunderModel, f.FakeModel):
+    name1 = models.TextField(null=True, blank=True)
+    name2 = models.TextField(null=True, blank=True)
+    number = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        dunder_max_field_length = 10
+
+
+def test_limit_binary():
+    item = LimitDefault(id=1, data=b'a' * 1000)
+
+    assert str(item) == '<LimitDefault: id=1, data=<1000 bytes>>'
+    assert repr(item) == 'LimitDefault(id=1, data=<1000 bytes>)'
+
+
+def test_limit_field_length():
+    item = LimitDefault(id=1, name1='a' * 1000, name2='b')
+
+    app_settings.MAX_FIELD_LENGTH = 10
+    try:
+        assert str(item) == '<LimitDefault: id=1, name1=aaaaaaa..., name2=b>'
+        assert repr(item) == (
+            "LimitDefault(id=1, name1='aaaaaaa...', name2='b')")
+    finally:
+        app_settings.MAX_FIELD_LENGTH = None
+
+    assert str(item) == '<LimitDefault: id=1, name1={}, name2=b>'.format(
+        'a' * 1000)
+
+
+def test_limit_length():
+    item = LimitDefault(id=1, name1='a' * 1000, name2='b' * 1000)
+
+    app_settings.MAX_LENGTH = 30
+    try:
+        assert str(item) == '<LimitDefault: id=1, name1={}...>'.format('a' * 15)
+    finally:
+        app_settings.MAX_LENGTH = None
+
+
+def test_limit_meta():
+    item = LimitMeta(id=1, name1='a' * 1000, number=10 ** 20)
+
+    assert str(item) == '<LimitMeta: id=1, name1=aaaaaaa..., number=1000000...>'
+
+
+def test_container_repr():
+    limited = ContainerRepr(max_depth=2, max_items=3, max_string=6)
+
+    assert limited.repr({'a': list(range(50000))}) == (
+        "{'a': [0, 1, 2, ...(49997 more)]}")
+    assert limited.repr({'b': 1, 'a': {'c': [1]}}) == (
+        "{'b': 1, 'a': {'c': [...]}}")
+    assert limited.repr(['abcdefghij', (1,), ()]) == (
+        "['abc...', (1,), ()]")
+    assert limited.repr({1, 2, 3, 4}) == '{1, 2, 3, ...(1 more)}'
+    assert limited.repr(frozenset()) == 'frozenset()'
+
+    assert ContainerRepr().repr({'a': [1, (2, 3)]}) == "{'a': [1, (2, 3)]}"
+
+
+def test_limit_container():
+    limited = ContainerRepr(max_items=1)
+
+    assert limit_container('abc', limited) == 'abc'
+    assert str(limit_container([1, 2], limited)) == '[1, ...(1 more)]'
+
+
+class LimitJSON(DunderModel, f.FakeModel):
+    payload = models.JSONField(null=True, blank=True)
+    other = models.TextField(null=True, blank=True)
+
+
+def test_limit_container_field():
+    item = LimitJSON(id=1, payload={'a': list(range(50000))}, other='x')
+
+    app_settings.MAX_ITEMS = 3
+    try:
+        assert str(item) == (
+            "<LimitJSON: id=1, payload={'a': [0, 1, 2, ...(49997 more)]}, "
+            "other=x>")
+        assert repr(item) == (
+            "LimitJSON(id=1, payload={'a': [0, 1, 2, ...(49997 more)]}, "
+            "other='x')")
+    finally:
+        app_settings.MAX_ITEMS = 100
+
+    item.payload = 'abc'
+    assert str(item) == '<LimitJSON: id=1, payload=abc, other=x>'
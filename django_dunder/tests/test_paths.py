@@ -0,0 +1,195 @@
+import pytest
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import (
+    app_settings,
+    render_instances,
+    render_queryset,
+)
+from django_dunder._plan import get_plan, resolve_path
+from django_dunder.mixins import DunderManager, DunderModel
+
+from django_fake_model import models as f
+
+
+class PathPublisher(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class PathTag(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class PathAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    publisher = models.ForeignKey(
+        PathPublisher, null=True, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(PathTag)
+
+    objects = DunderManager()
+
+    class Meta:
+        str_fields = ('name', 'tags__name')
+
+
+class PathTagged(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+    tags = models.ManyToManyField(PathTag, related_name='+')
+
+    class Meta:
+        str_fields = ('name', 'tags__name')
+
+
+class PathBook(DunderModel, f.FakeModel):
+    title = models.TextField()
+    author = models.ForeignKey(PathAuthor, on_delete=models.CASCADE)
+
+    objects = DunderManager()
+
+    class Meta:
+        str_fields = ('title', 'author__name', 'author__publisher__name')
+        repr_fields = ('title', 'author__name', 'author__missing')
+
+
+def test_resolve_path():
+    path = resolve_path(PathBook, 'author__publisher__name')
+    assert path.accessors == ('author', 'publisher')
+    assert path.field is PathPublisher._meta.get_field('name')
+    assert not path.many
+
+    path = resolve_path(PathAuthor, 'tags__name')
+    assert path.accessors == ('tags', )
+    assert path.many
+
+    assert resolve_path(PathBook, 'author__missing') is None
+    assert resolve_path(PathBook, 'title__name') is None
+    assert resolve_path(PathBook, 'author__tags') is None
+
+
+def test_plan_paths():
+    plan = get_plan(PathBook, 'str_fields')
+    assert sorted(plan.paths) == ['author__name', 'author__publisher__name']
+    assert plan.select_related == ('author', 'author__publisher')
+    assert plan.prefetch_related == ()
+    assert plan.only == ('title', 'author__name', 'author__publisher__name')
+
+    plan = get_plan(PathBook, 'repr_fields')
+    assert [name for field, name in plan.items] == ['title', 'author__name']
+
+    plan = get_plan(PathAuthor, 'str_fields')
+    assert plan.select_related == ()
+    assert plan.prefetch_related == ('tags', )
+    assert plan.only == ('name', )
+
+
+@PathPublisher.fake_me
+@PathTag.fake_me
+@PathAuthor.fake_me
+@PathBook.fake_me
+def test_path_rendering():
+    publisher = PathPublisher.objects.create(name='p')
+    author = PathAuthor.objects.create(name='a', publisher=publisher)
+    PathBook.objects.create(title='t1', author=author)
+    PathBook.objects.create(title='t2', author=author)
+
+    # The related objects which are not loaded are not shown
+    item = PathBook.objects.filter(title='t1').get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == '<PathBook: title=t1>'
+    assert len(queries) == 0
+
+    # Not prefetched
+    item = PathAuthor.objects.get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == '<PathAuthor: name=a>'
+    assert len(queries) == 0
+
+    with CaptureQueriesContext(connection) as queries:
+        item = PathBook.objects.filter(title='t1').for_display().get()
+        assert str(item) == (
+            '<PathBook: title=t1, author__name=a, '
+            'author__publisher__name=p>')
+    assert len(queries) == 1
+
+    item = PathBook.objects.select_related('author').get(title='t1')
+    assert repr(item) == "PathBook(title='t1', author__name='a')"
+
+    app_settings.FETCH_RELATED = True
+    try:
+        item = PathBook.objects.get(title='t2')
+        with CaptureQueriesContext(connection) as queries:
+            assert str(item) == (
+                '<PathBook: title=t2, author__name=a, '
+                'author__publisher__name=p>')
+        assert len(queries) == 2
+    finally:
+        app_settings.FETCH_RELATED = False
+
+
+@PathPublisher.fake_me
+@PathTag.fake_me
+@PathAuthor.fake_me
+@PathBook.fake_me
+def test_path_render_queryset():
+    publisher = PathPublisher.objects.create(name='p')
+    author = PathAuthor.objects.create(name='a', publisher=publisher)
+    PathBook.objects.create(title='t1', author=author)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert list(render_queryset(PathBook.objects.all())) == [
+            '<PathBook: title=t1, author__name=a, '
+            'author__publisher__name=p>',
+        ]
+    assert len(queries) == 1
+
+    with pytest.raises(ValueError):
+        list(render_queryset(PathAuthor.objects.all()))
+
+
+@PathPublisher.fake_me
+@PathTag.fake_me
+@PathAuthor.fake_me
+@PathBook.fake_me
+def test_path_many(relation_tree):
+    author = PathAuthor.objects.create(name='a')
+    author.tags.add(
+        PathTag.objects.create(name='x'), PathTag.objects.create(name='y'))
+
+    with CaptureQueriesContext(connection) as queries:
+        item = PathAuthor.objects.for_display().get()
+        assert str(item) == "<PathAuthor: name=a, tags__name=['x', 'y']>"
+    assert len(queries) == 2
+
+    items = list(PathAuthor.objects.all())
+    with CaptureQueriesContext(connection) as queries:
+        assert render_instances(items) == [
+            "<PathAuthor: name=a, tags__name=['x', 'y']>"]
+    assert len(queries) == 1
+
+
+@PathTag.fake_me
+@PathTagged.fake_me
+def test_path_two_fields(relation_tree):
+    item = PathTagged.objects.create(name='a')
+    item.tags.add(PathTag.objects.create(name='x'))
+
+    # The name is not taken for the 'id' of a model with two fields
+    item = PathTagged.objects.prefetch_related('tags').get()
+    assert str(item) == "<PathTagged: name=a, tags__name=['x']>"
+
+
+@PathTag.fake_me
+@PathAuthor.fake_me
+def test_path_unsaved(relation_tree):
+    item = PathAuthor(name='new')
+    assert str(item) == '<PathAuthor: name=new>'
+    assert render_instances([item]) == ['<PathAuthor: name=new>']
+
+    app_settings.FETCH_RELATED = True
+    try:
+        assert str(item) == '<PathAuthor: name=new>'
+        assert render_instances([item]) == ['<PathAuthor: name=new>']
+    finally:
+        app_settings.FETCH_RELATED = False
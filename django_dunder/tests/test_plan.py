@@ -0,0 +1,110 @@
+from django.apps import apps
+from django.apps.registry import Apps
+from django.db import models
+from django.test.utils import override_settings
+
+from django_dunder import app_settings
+from django_dunder.mixins import DunderModel
+from django_dunder._plan import _plans, get_plan
+
+from django_fake_model import models as f
+
+
+class PlanUnique(DunderModel, f.FakeModel):
+    name1 = models.TextField(unique=True)
+    name2 = models.TextField(null=True, blank=True)
+
+
+class PlanUniqueProxy(PlanUnique):
+
+    class Meta:
+        proxy = True
+
+
+class PlanExplicitProxy(PlanUnique):
+
+    class Meta:
+        proxy = True
+        str_fields = ('name2', )
+
+
+def test_plan_cached():
+    plan = get_plan(PlanUnique, 'str_fields')
+    assert get_plan(PlanUnique, 'str_fields') is plan
+    assert get_plan(PlanUnique, 'repr_fields') is not plan
+
+    assert [name for field, name in plan.items] == ['name1']
+    assert plan.pk_field.name == 'id'
+    assert not plan.drop_pk
+
+
+def test_plan_proxy_shared():
+    plan = get_plan(PlanUnique, 'str_fields')
+    assert get_plan(PlanUniqueProxy, 'str_fields') is plan
+
+    proxy_plan = get_plan(PlanExplicitProxy, 'str_fields')
+    assert proxy_plan is not plan
+    assert [name for field, name in proxy_plan.items] == ['name2']
+
+
+@PlanUnique.fake_me
+def test_plan_proxy_render():
+    PlanUnique.objects.create(name1='a', name2='b')
+
+    assert str(PlanUniqueProxy.objects.get()) == '<PlanUniqueProxy: name1=a>'
+    assert str(PlanExplicitProxy.objects.get()) == '<PlanExplicitProxy: name2=b>'
+
+
+def test_plan_setting_changed():
+    get_plan(PlanUnique, 'str_fields')
+    assert _plans
+
+    with override_settings(DUNDER_STR_FMT='[{}: {}]'):
+        assert not _plans
+        assert app_settings.STR_FMT == '[{}: {}]'
+
+    assert app_settings.STR_FMT == '<{}: {}>'
+
+
+def _remove_model(model):
+    del apps.all_models['dunder'][model._meta.model_name]
+    apps.clear_cache()
+
+
+def test_plan_new_model():
+    plan = get_plan(PlanUnique, 'str_fields')
+    proxy_plan = get_plan(PlanExplicitProxy, 'str_fields')
+
+    class PlanHistorical(models.Model):
+        plan = models.ForeignKey(PlanUnique, on_delete=models.CASCADE)
+
+        class Meta:
+            app_label = 'dunder'
+            apps = Apps()
+
+    assert get_plan(PlanUnique, 'str_fields') is plan
+
+    class PlanOther(models.Model):
+        name = models.TextField()
+
+        class Meta:
+            app_label = 'dunder'
+
+    try:
+        assert get_plan(PlanUnique, 'str_fields') is plan
+        assert get_plan(PlanExplicitProxy, 'str_fields') is proxy_plan
+    finally:
+        _remove_model(PlanOther)
+
+    # PlanUnique and its proxies have a new reverse relation
+    class PlanRelated(models.Model):
+        plan = models.ForeignKey(PlanUnique, on_delete=models.CASCADE)
+
+        class Meta:
+            app_label = 'dunder'
+
+    try:
+        assert get_plan(PlanUnique, 'str_fields') is not plan
+        assert get_plan(PlanExplicitProxy, 'str_fields') is not proxy_plan
+    finally:
+        _remove_model(PlanRelated)
@@ -0,0 +1,69 @@
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_dunder import app_settings
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+
+class RelAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class RelBook(DunderModel, f.FakeModel):
+    author = models.ForeignKey(RelAuthor, on_delete=models.CASCADE)
+
+
+class RelBookFetch(DunderModel, f.FakeModel):
+    author = models.ForeignKey(RelAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        dunder_fetch_related = True
+
+
+@RelAuthor.fake_me
+@RelBook.fake_me
+def test_related_cached_only():
+    author = RelAuthor.objects.create(name='a')
+    RelBook.objects.create(author=author)
+
+    item = RelBook.objects.get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == '<RelBook: author_id=1>'
+        assert repr(item) == 'RelBook(author_id=1)'
+    assert len(queries) == 0
+
+    item = RelBook.objects.select_related('author').get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == '<RelBook: author=<RelAuthor: name=a>>'
+        assert repr(item) == "RelBook(author=RelAuthor(name='a'))"
+    assert len(queries) == 0
+
+
+@RelAuthor.fake_me
+@RelBook.fake_me
+def test_related_fetch_setting():
+    author = RelAuthor.objects.create(name='a')
+    RelBook.objects.create(author=author)
+
+    app_settings.FETCH_RELATED = True
+    try:
+        item = RelBook.objects.get()
+        with CaptureQueriesContext(connection) as queries:
+            assert str(item) == '<RelBook: author=<RelAuthor: name=a>>'
+        assert len(queries) == 1
+    finally:
+        app_settings.FETCH_RELATED = False
+
+
+@RelAuthor.fake_me
+@RelBookFetch.fake_me
+def test_related_fetch_meta():
+    author = RelAuthor.objects.create(name='a')
+    RelBookFetch.objects.create(author=author)
+
+    item = RelBookFetch.objects.get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == '<RelBookFetch: author=<RelAuthor: name=a>>'
+    assert len(queries) == 1
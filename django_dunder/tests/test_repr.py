@@ -1,8 +1,10 @@
+import gc
+
 from django.db import models
 
 from django_nine.versions import DJANGO_GTE_2_0
 
-from django_dunder.core import _model_name_counter
+from django_dunder.core import ModelNames, _model_names
 from django_dunder.mixins import DunderReprModel
 from django_dunder._register import _has_default_repr
 
@@ -124,9 +126,12 @@ class NameConflict2(DunderReprModel, f.FakeModel):
 @NameConflict1.fake_me
 @NameConflict2.fake_me
 def test_repr_explicit_app():
-    # Simulate them having the same name in different apps
-    _model_name_counter['NameConflict1'] = 2
-    _model_name_counter['NameConflict2'] = 2
+    # Simulate them having the same name as classes in other apps
+    others = [
+        type(name, (object, ), {})
+        for name in ('NameConflict1', 'NameConflict2')]
+    for other in others:
+        _model_names.add(other)
 
     item1 = NameConflict1.objects.create()
     item2 = NameConflict2.objects.create()
@@ -134,6 +139,36 @@ def test_repr_explicit_app():
     assert repr(item1) == 'myapp1.NameConflict1(id=1)'
     assert repr(item2) == 'myapp2.NameConflict2(id=1)'
 
+    # The names are shown again when the other classes are released
+    del others, other
+    gc.collect()
+
+    assert repr(item1) == 'NameConflict1(id=1)'
+
+
+def test_model_names_released():
+    names = ModelNames()
+
+    def make_class(label):
+        meta = type('Meta', (object, ), {'label': label})
+        return type('Dynamic', (object, ), {'_meta': meta})
+
+    first = make_class('app1.Dynamic')
+    assert names[first] == 'Dynamic'
+
+    for i in range(100):
+        cls = make_class('app2.Dynamic')
+        assert names[cls] == 'app2.Dynamic'
+        assert names[first] == 'app1.Dynamic'
+        del cls
+        gc.collect()
+
+    assert names[first] == 'Dynamic'
+    del first
+    gc.collect()
+
+    assert len(names) == 0
+
 
 class ReprHasDunderRepr(f.FakeModel):
     name = models.TextField(null=True, blank=True)
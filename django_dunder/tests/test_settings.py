@@ -1,4 +1,5 @@
 from functools import partial
+import re
 
 from django_dunder import app_settings
 
@@ -79,3 +80,44 @@ def test_auto_repr():
     app_settings.REPR_EXCLUDE = ['a']
     assert not _should_force_repr('a', None, lambda x: True)
     assert _should_force_repr('b', None, lambda x: True)
+
+
+def test_LabelMatcher():
+    obj = app_settings._LabelMatcher(
+        ['a.B', 'auth.*', '*.Historical*', '^x\\.(Y|Z)$',
+         re.compile('other\\.[0-9]+')])
+    assert obj
+    assert obj == [
+        'a.B', 'auth.*', '*.Historical*', '^x\\.(Y|Z)$',
+        re.compile('other\\.[0-9]+')]
+
+    assert 'a.B' in obj
+    assert 'a.b' not in obj
+    assert 'auth.User' in obj
+    assert 'myauth.User' not in obj
+    assert 'app.HistoricalPerson' in obj
+    assert 'app.Person' not in obj
+    assert 'x.Y' in obj
+    assert 'x.YY' not in obj
+    assert 'other.1' in obj
+    assert 'another.1' not in obj
+
+    # Cached
+    assert 'auth.User' in obj._cache
+
+    obj = app_settings._LabelMatcher([])
+    assert not obj
+    assert 'a' not in obj
+
+
+def test_exclude_patterns():
+    app_settings.FORCE = False
+    app_settings.AUTO_REPR = True
+    app_settings.FORCE_REPR = []
+    app_settings.REPR_EXCLUDE = ['auth.*']
+
+    app_settings._post_process()
+
+    assert isinstance(app_settings.REPR_EXCLUDE, app_settings._LabelMatcher)
+    assert not _should_force_repr('auth.User', None, lambda x: True)
+    assert _should_force_repr('app.User', None, lambda x: True)
@@ -0,0 +1,108 @@
+import json
+
+from django.core.management import call_command
+from django.db import models
+
+from django_dunder import app_settings, stats
+from django_dunder import _stats
+from django_dunder._stats import read_stats, write_stats
+from django_dunder.mixins import DunderModel
+
+from django_fake_model import models as f
+
+try:
+    from io import StringIO
+except ImportError:  # Python 2
+    from StringIO import StringIO
+
+
+class StatsAuthor(DunderModel, f.FakeModel):
+    name = models.TextField(unique=True)
+
+
+class StatsBook(DunderModel, f.FakeModel):
+    author = models.ForeignKey(StatsAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        dunder_fetch_related = True
+
+
+@StatsAuthor.fake_me
+@StatsBook.fake_me
+def test_stats():
+    author = StatsAuthor.objects.create(name='a')
+    StatsBook.objects.create(author=author)
+    stats(reset=True)
+
+    item = StatsBook.objects.get()
+    str(item)
+    assert stats() == []
+
+    app_settings.STATS = True
+    try:
+        item = StatsBook.objects.get()
+        assert str(item) == '<StatsBook: author=<StatsAuthor: name=a>>'
+        assert str(item) == '<StatsBook: author=<StatsAuthor: name=a>>'
+        assert repr(author) == "StatsAuthor(name='a')"
+    finally:
+        app_settings.STATS = False
+
+    items = dict(
+        ((item['model'], item['mode']), item) for item in stats())
+    assert sorted(items) == [
+        ('dunder.StatsAuthor', 'repr'),
+        ('dunder.StatsAuthor', 'str'),
+        ('dunder.StatsBook', 'str'),
+    ]
+
+    book = items[('dunder.StatsBook', 'str')]
+    assert book['calls'] == 2
+    assert book['queries'] == 1
+    assert book['max_length'] == len('<StatsBook: author=<StatsAuthor: name=a>>')
+    assert 0 < book['p50'] <= book['max']
+    assert book['time'] >= book['max']
+
+    assert items[('dunder.StatsAuthor', 'str')]['calls'] == 2
+    assert items[('dunder.StatsAuthor', 'repr')]['queries'] == 0
+
+    out = StringIO()
+    call_command('dunder_stats', stdout=out)
+    assert 'dunder.StatsBook' in out.getvalue()
+
+    out = StringIO()
+    call_command('dunder_stats', json=True, reset=True, stdout=out)
+    assert len(json.loads(out.getvalue())) == 3
+
+    assert stats() == []
+
+
+@StatsAuthor.fake_me
+def test_stats_dir(tmpdir, monkeypatch):
+    directory = str(tmpdir)
+    monkeypatch.setattr(_stats, '_written', 0.0)
+    author = StatsAuthor.objects.create(name='a')
+    stats(reset=True)
+
+    app_settings.STATS = True
+    app_settings.STATS_DIR = directory
+    try:
+        # The first render is written at once, the second is not yet
+        str(author)
+        str(author)
+        assert read_stats(directory)[0]['calls'] == 1
+
+        write_stats(directory)
+    finally:
+        app_settings.STATS = False
+        app_settings.STATS_DIR = None
+
+    # Another process only sees what was written
+    stats(reset=True)
+    out = StringIO()
+    call_command('dunder_stats', json=True, dir=directory, stdout=out)
+    items = json.loads(out.getvalue())
+    assert [(item['model'], item['mode'], item['calls']) for item in items] == [
+        ('dunder.StatsAuthor', 'str', 2)]
+
+    call_command('dunder_stats', dir=directory, reset=True, stdout=StringIO())
+    assert read_stats(directory) == []
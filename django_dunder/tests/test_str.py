@@ -1,8 +1,10 @@
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 
 from django_nine.versions import DJANGO_GTE_2_0
 
-from django_dunder.core import _model_name_counter
+from django_dunder import app_settings
+from django_dunder.core import _model_names
 from django_dunder.mixins import DunderStrModel
 from django_dunder._register import _has_default_str
 
@@ -157,9 +159,12 @@ class StrNameConflict2(DunderStrModel, f.FakeModel):
 @StrNameConflict1.fake_me
 @StrNameConflict2.fake_me
 def test_str_explicit_app():
-    # Simulate them having the same name in different apps
-    _model_name_counter['StrNameConflict1'] = 2
-    _model_name_counter['StrNameConflict2'] = 2
+    # Simulate them having the same name as classes in other apps
+    others = [
+        type(name, (object, ), {})
+        for name in ('StrNameConflict1', 'StrNameConflict2')]
+    for other in others:
+        _model_names.add(other)
 
     item1 = StrNameConflict1.objects.create()
     item2 = StrNameConflict2.objects.create()
@@ -205,3 +210,28 @@ def test_auto_ignore_existing_inheritance():
     item = StrHasDunderStrChild.objects.create()
 
     assert str(item) == 'model.__str__'
+
+
+@StrDefault.fake_me
+def test_str_deferred():
+    StrDefault.objects.create(name1='a', name2='b')
+
+    app_settings.SKIP_DEFERRED = True
+    try:
+        item = StrDefault.objects.only('name1').get()
+        with CaptureQueriesContext(connection) as queries:
+            assert str(item) == '<StrDefault: id=1, name1=a>'
+        assert len(queries) == 0
+
+        app_settings.DEFERRED_PLACEHOLDER = '...'
+        with CaptureQueriesContext(connection) as queries:
+            assert str(item) == '<StrDefault: id=1, name1=a, name2=...>'
+        assert len(queries) == 0
+    finally:
+        app_settings.SKIP_DEFERRED = False
+        app_settings.DEFERRED_PLACEHOLDER = None
+
+    item = StrDefault.objects.only('name1').get()
+    with CaptureQueriesContext(connection) as queries:
+        assert str(item) == '<StrDefault: id=1, name1=a, name2=b>'
+    assert len(queries) == 1
@@ -1,7 +1,11 @@
 from __future__ import unicode_literals
 
+import warnings
+
+from django.apps.registry import Apps
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
+from django.db.models.signals import class_prepared
 
 try:
     from django.utils.encoding import python_2_unicode_compatible
@@ -9,7 +13,12 @@ except ImportError:
     from six import python_2_unicode_compatible
 
 import django_dunder.app_settings as app_settings
-from django_dunder._register import _has_default_str, PY3
+from django_dunder._register import (
+    PY3,
+    _has_default_str,
+    _model_cls_patcher,
+    _register_existing_models,
+)
 
 from django_fake_model import models as f
 
@@ -235,3 +244,49 @@ def test_unicode_dunder_compat():
         assert StrHasDunderUnicodeCompat.__unicode__ == unicode_func
 
     app_settings.COPY_UNICODE = False
+
+
+def test_register_existing_models():
+    any_register = app_settings._ANY_REGISTER
+    auto_repr = app_settings.AUTO_REPR
+    app_settings._ANY_REGISTER = True
+    app_settings.AUTO_REPR = False
+    app_settings.AUTO_STR = True
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            _register_existing_models([StrDualDunder, StrDunderDupped])
+    finally:
+        class_prepared.disconnect(_model_cls_patcher)
+        app_settings._ANY_REGISTER = any_register
+        app_settings.AUTO_REPR = auto_repr
+        app_settings.AUTO_STR = False
+
+    if PY3:
+        assert len(caught) == 1
+        message = str(caught[0].message)
+        assert message.startswith('django-dunder found 2 issues')
+        assert 'StrDualDunder.__unicode__ is different' in message
+        assert 'StrDunderDupped.__unicode__ is duplicating' in message
+    else:
+        assert not caught
+
+
+def test_historical_models_skipped():
+    class StrHistorical(models.Model):
+        name = models.TextField(null=True, blank=True)
+
+        class Meta:
+            app_label = 'dunder'
+            apps = Apps()
+
+    any_register = app_settings._ANY_REGISTER
+    app_settings._ANY_REGISTER = True
+    app_settings.AUTO_STR = True
+    try:
+        _model_cls_patcher(StrHistorical)
+    finally:
+        app_settings._ANY_REGISTER = any_register
+        app_settings.AUTO_STR = False
+
+    assert StrHistorical.__str__ is models.Model.__str__